@@ -0,0 +1,440 @@
+"""
+Deduplication module for FlexETL.
+
+Removes rows whose key columns were already seen in an earlier chunk or
+an earlier run. Keys are hashed into 64-bit fingerprints which are kept
+in a compact sorted-array set, or in a Bloom filter for bounded memory.
+"""
+
+import logging
+import math
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union, cast
+
+import numpy as np
+import pandas as pd
+
+from flexetl.logging_config import SampledLogger
+
+
+logger = logging.getLogger(__name__)
+
+# Hash given to nulls in every column, whatever the column's dtype.
+_NULL_HASH = np.uint64(0x6A09E667F3BCC908)
+
+
+def _first_in_sorted(values: np.ndarray) -> np.ndarray:
+    """Mask the first occurrence of each value in a sorted array."""
+    mask = np.ones(len(values), dtype=bool)
+    mask[1:] = values[1:] != values[:-1]
+    return mask
+
+
+class FingerprintSet:
+    """
+    Exact set of 64-bit fingerprints backed by sorted numpy arrays.
+
+    New fingerprints are kept as a stack of sorted runs whose sizes at
+    least double towards the bottom, so inserts are amortized
+    O(n log n) and lookups binary-search a logarithmic number of runs.
+    """
+
+    def __init__(self, fingerprints: Optional[np.ndarray] = None) -> None:
+        """
+        Initialize fingerprint set.
+
+        Args:
+            fingerprints: Optional initial fingerprints.
+        """
+        self._runs: List[np.ndarray] = []
+        if fingerprints is not None:
+            self.add(fingerprints)
+
+    def __len__(self) -> int:
+        """Return number of fingerprints in the set."""
+        return sum(len(run) for run in self._runs)
+
+    def contains(self, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Test membership of each fingerprint.
+
+        Args:
+            fingerprints: Array of uint64 fingerprints.
+
+        Returns:
+            Boolean array, True where the fingerprint is in the set.
+        """
+        found = np.zeros(len(fingerprints), dtype=bool)
+        for run in self._runs:
+            pos = np.searchsorted(run, fingerprints)
+            pos[pos == len(run)] = 0
+            found |= run[pos] == fingerprints
+        return found
+
+    def add(self, fingerprints: np.ndarray) -> None:
+        """
+        Add fingerprints to the set.
+
+        Args:
+            fingerprints: Array of uint64 fingerprints.
+        """
+        run = np.sort(fingerprints.astype(np.uint64))
+        run = run[_first_in_sorted(run)]
+        run = run[~self.contains(run)]
+        # Runs are disjoint, so merging is a concatenation plus a sort
+        # that timsort turns into a linear merge of the two sorted halves.
+        while self._runs and len(self._runs[-1]) <= 2 * len(run):
+            run = np.sort(
+                np.concatenate([self._runs.pop(), run]), kind='stable'
+            )
+        if len(run):
+            self._runs.append(run)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Return all fingerprints as one sorted array.
+
+        Returns:
+            Sorted uint64 array.
+        """
+        if not self._runs:
+            return np.empty(0, dtype=np.uint64)
+        merged = np.sort(np.concatenate(self._runs), kind='stable')
+        self._runs = [merged]
+        return merged
+
+
+def _mix(values: np.ndarray, seed: int) -> np.ndarray:
+    """Rehash uint64 values with a seeded splitmix64-style finalizer."""
+    mixed = (values ^ np.uint64(seed)) * np.uint64(0x9E3779B97F4A7C15)
+    mixed ^= mixed >> np.uint64(29)
+    mixed *= np.uint64(0xBF58476D1CE4E5B9)
+    mixed ^= mixed >> np.uint64(32)
+    return cast(np.ndarray, mixed)
+
+
+def _hash_column(column: pd.Series) -> np.ndarray:
+    """
+    Hash a column so equal values match across dtypes.
+
+    Integers and booleans are hashed as 64-bit integers without loss.
+    Whole-valued floats in the int64 range are hashed as those integers,
+    so an int64 chunk matches a float64 chunk that has nulls; other
+    floats are hashed as float64. Everything else is hashed as Python
+    objects, so a categorical chunk matches an object one. Nulls get the
+    same hash in every dtype.
+    """
+    dtype = column.dtype
+    if pd.api.types.is_bool_dtype(dtype) or pd.api.types.is_integer_dtype(
+        dtype
+    ):
+        # uint64 hashes by bit pattern, like int64 for shared values.
+        target = (
+            np.uint64 if pd.api.types.is_unsigned_integer_dtype(dtype)
+            else np.int64
+        )
+        hashed = pd.util.hash_array(column.to_numpy(dtype=target, na_value=0))
+    elif pd.api.types.is_numeric_dtype(dtype):
+        values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid='ignore'):
+            whole = (
+                (values == np.floor(values))
+                & (values >= -2.0 ** 63) & (values < 2.0 ** 63)
+            )
+        hashed = pd.util.hash_array(
+            np.where(whole, values, 0).astype(np.int64)
+        )
+        fractional = ~whole & ~np.isnan(values)
+        if fractional.any():
+            # Adding 0.0 turns -0.0 into 0.0.
+            hashed = np.where(
+                fractional, pd.util.hash_array(values + 0.0), hashed
+            )
+    else:
+        hashed = pd.util.hash_array(column.to_numpy(dtype=object))
+
+    hashed[column.isna().to_numpy()] = _NULL_HASH
+    return hashed
+
+
+class BloomFilter:
+    """
+    Sectorized Bloom filter over 64-bit fingerprints with fixed memory.
+
+    The bits for a fingerprint are spread over a few 64-bit words, a
+    handful per word, so an insert or lookup touches about a third as
+    many memory locations as a classic Bloom filter. May report a
+    fingerprint as present when it is not (at roughly the configured
+    error rate once ``capacity`` items are added), never the other way
+    round.
+    """
+
+    BITS_PER_WORD = 3
+
+    def __init__(self, capacity: int, error_rate: float = 0.001) -> None:
+        """
+        Initialize Bloom filter sized for the expected number of items.
+
+        Args:
+            capacity: Expected number of distinct fingerprints.
+            error_rate: Target false positive rate at full capacity.
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range.
+        """
+        if capacity < 1:
+            raise ValueError(f"Capacity must be >= 1: {capacity}")
+        if not 0 < error_rate < 1:
+            raise ValueError(
+                f"Error rate must be between 0 and 1: {error_rate}"
+            )
+
+        num_bits = -capacity * math.log(error_rate) / math.log(2) ** 2
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self.num_words = math.ceil(num_hashes / self.BITS_PER_WORD)
+        self.words = np.zeros(max(1, math.ceil(num_bits / 64)), np.uint64)
+
+    def contains(self, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Test membership of each fingerprint.
+
+        Args:
+            fingerprints: Array of uint64 fingerprints.
+
+        Returns:
+            Boolean array, True where the fingerprint may be present.
+        """
+        found = np.ones(len(fingerprints), dtype=bool)
+        for index, mask in self._locate(fingerprints):
+            found &= (self.words[index] & mask) == mask
+        return found
+
+    def add(self, fingerprints: np.ndarray) -> None:
+        """
+        Add fingerprints to the filter.
+
+        Args:
+            fingerprints: Array of uint64 fingerprints.
+        """
+        for index, mask in self._locate(fingerprints):
+            np.bitwise_or.at(self.words, index, mask)
+
+    def _locate(
+        self,
+        fingerprints: np.ndarray
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Return a word index and bit mask per fingerprint and sector."""
+        fingerprints = fingerprints.astype(np.uint64)
+        size = np.uint64(len(self.words))
+        located = []
+
+        for sector in range(self.num_words):
+            hashed = _mix(fingerprints, sector + 1)
+            index = ((hashed >> np.uint64(32)) % size).astype(np.int64)
+
+            # An odd step modulo 64 gives distinct bit offsets.
+            start = hashed & np.uint64(63)
+            step = ((hashed >> np.uint64(6)) & np.uint64(63)) | np.uint64(1)
+            mask = np.zeros(len(fingerprints), dtype=np.uint64)
+            for i in range(self.BITS_PER_WORD):
+                offset = (start + np.uint64(i) * step) & np.uint64(63)
+                mask |= np.left_shift(np.uint64(1), offset)
+
+            located.append((index, mask))
+
+        return located
+
+
+class Deduplicator:
+    """Drop rows whose key columns were already seen."""
+
+    def __init__(
+        self,
+        key_columns: List[str],
+        state_path: Optional[str] = None,
+        mode: str = 'exact',
+        bloom_capacity: int = 10_000_000,
+        bloom_error_rate: float = 0.001
+    ) -> None:
+        """
+        Initialize deduplicator.
+
+        Args:
+            key_columns: Columns that identify a row.
+            state_path: Optional path of a ``.npy`` (exact) or ``.npz``
+                        (bloom) file holding fingerprints from earlier
+                        runs. Loaded if it exists; written by
+                        ``save_state()``.
+            mode: 'exact' for a sorted-array set, or 'bloom' for a
+                  fixed-size Bloom filter that may drop a small fraction
+                  of unique rows.
+            bloom_capacity: Expected distinct keys in bloom mode.
+            bloom_error_rate: False positive rate in bloom mode.
+
+        Raises:
+            ValueError: If key_columns is empty or mode is invalid.
+        """
+        if not key_columns:
+            raise ValueError("At least one key column is required")
+        if mode not in ('exact', 'bloom'):
+            raise ValueError(f"Invalid dedup mode: {mode}")
+
+        self.key_columns = key_columns
+        self.state_path = Path(state_path) if state_path else None
+        self.mode = mode
+        self.rows_seen = 0
+        self.duplicates_removed = 0
+        self._chunk_log = SampledLogger(logger)
+        self._lock = threading.Lock()
+
+        self.seen: Union[FingerprintSet, BloomFilter]
+        if mode == 'exact':
+            self.seen = self._load_exact()
+        else:
+            self.seen = self._load_bloom(bloom_capacity, bloom_error_rate)
+
+    def fingerprint(self, dataframe: pd.DataFrame) -> np.ndarray:
+        """
+        Hash the key columns of each row into a 64-bit fingerprint.
+
+        Key columns are hashed in a canonical type, so the same row gets
+        the same fingerprint whether a chunk read a column as int64 or
+        float64 (e.g. because of a null), or as strings or categories.
+
+        Args:
+            dataframe: DataFrame containing the key columns.
+
+        Returns:
+            uint64 array with one fingerprint per row.
+
+        Raises:
+            ValueError: If a key column is missing.
+        """
+        for column in self.key_columns:
+            if column not in dataframe.columns:
+                raise ValueError(f"Column not found: {column}")
+
+        fingerprints = np.zeros(len(dataframe), dtype=np.uint64)
+        for position, column in enumerate(self.key_columns, start=1):
+            fingerprints = _mix(
+                fingerprints ^ _hash_column(dataframe[column]), position
+            )
+        return fingerprints
+
+    def deduplicate(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Return rows whose keys were not seen before and remember them.
+
+        Args:
+            dataframe: Chunk to deduplicate.
+
+        Returns:
+            DataFrame keeping the first occurrence of each new key.
+
+        Raises:
+            ValueError: If a key column is missing.
+        """
+        fingerprints = self.fingerprint(dataframe)
+
+        order = np.argsort(fingerprints, kind='stable')
+        first = order[_first_in_sorted(fingerprints[order])]
+        keep = np.zeros(len(fingerprints), dtype=bool)
+        keep[first] = True
+        removed = len(dataframe) - len(first)
+
+        # Check-and-add must be atomic when chunks run in parallel.
+        with self._lock:
+            seen = self.seen.contains(fingerprints[first])
+            keep[first[seen]] = False
+            self.seen.add(fingerprints[keep])
+            removed += int(seen.sum())
+            self.rows_seen += len(dataframe)
+            self.duplicates_removed += removed
+        self._chunk_log.log(
+            'deduplicate', removed,
+            "Removed %d duplicate rows of %d", removed, len(dataframe)
+        )
+
+        if removed == 0:
+            return dataframe
+        return cast(pd.DataFrame, dataframe[keep])
+
+    def save_state(self) -> None:
+        """
+        Persist seen fingerprints to ``state_path``.
+
+        Call this only after the deduplicated rows have been loaded so
+        that a failed run does not mark its rows as seen. The file is
+        written to a temporary name and then moved into place, so a crash
+        while saving leaves the previous state intact.
+        """
+        if self.state_path is None:
+            return
+
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=self.state_path.parent, prefix=f'.{self.state_path.name}.'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if isinstance(self.seen, BloomFilter):
+                    np.savez(
+                        f,
+                        words=self.seen.words,
+                        num_words=self.seen.num_words
+                    )
+                else:
+                    np.save(f, self.seen.to_array())
+            os.replace(tmp_name, self.state_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+
+        logger.info("Saved dedup state to %s", self.state_path)
+
+    def log_summary(self, stage: str = 'deduplicate') -> Dict[str, int]:
+        """
+        Log totals for this deduplicator.
+
+        Args:
+            stage: Stage name to include in the summary messages.
+
+        Returns:
+            Dict with rows seen and duplicates removed.
+        """
+        logger.info(
+            "%s: removed %d duplicates of %d rows",
+            stage, self.duplicates_removed, self.rows_seen
+        )
+        return {
+            'rows_seen': self.rows_seen,
+            'duplicates_removed': self.duplicates_removed
+        }
+
+    def _load_exact(self) -> FingerprintSet:
+        """Load an exact fingerprint set from state_path if present."""
+        if self.state_path is None or not self.state_path.exists():
+            return FingerprintSet()
+
+        fingerprints = np.load(self.state_path)
+        logger.info(
+            "Loaded %d fingerprints from %s",
+            len(fingerprints), self.state_path
+        )
+        return FingerprintSet(fingerprints)
+
+    def _load_bloom(self, capacity: int, error_rate: float) -> BloomFilter:
+        """Load a Bloom filter from state_path if present."""
+        bloom = BloomFilter(capacity, error_rate)
+        if self.state_path is None or not self.state_path.exists():
+            return bloom
+
+        with np.load(self.state_path) as state:
+            bloom.words = state['words']
+            bloom.num_words = int(state['num_words'])
+
+        logger.info("Loaded Bloom filter from %s", self.state_path)
+        return bloom
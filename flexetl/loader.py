@@ -8,12 +8,18 @@ Phase 1 supports SQLite database.
 import logging
 import sqlite3
 from pathlib import Path
+from typing import Iterable, Literal, Optional
 
 import pandas as pd
 
+from flexetl.logging_config import SampledLogger
+from flexetl.scalability import MemoryManager
+
 
 logger = logging.getLogger(__name__)
 
+IfExists = Literal['fail', 'replace', 'append']
+
 
 class SQLiteLoader:
     """Load data into SQLite database."""
@@ -22,7 +28,7 @@ class SQLiteLoader:
         self,
         database_path: str,
         table_name: str,
-        if_exists: str = 'replace'
+        if_exists: IfExists = 'replace'
     ) -> None:
         """
         Initialize SQLite loader.
@@ -36,15 +42,21 @@ class SQLiteLoader:
         self.database_path = Path(database_path)
         self.table_name = table_name
         self.if_exists = if_exists
+        self._chunk_log = SampledLogger(logger)
 
         self.database_path.parent.mkdir(parents=True, exist_ok=True)
 
-    def load(self, dataframe: pd.DataFrame) -> int:
+    def load(
+        self,
+        dataframe: pd.DataFrame,
+        if_exists: Optional[IfExists] = None
+    ) -> int:
         """
         Load DataFrame into SQLite database.
 
         Args:
             dataframe: DataFrame to load.
+            if_exists: Overrides the loader's ``if_exists`` for this call.
 
         Returns:
             Number of rows loaded.
@@ -57,8 +69,8 @@ class SQLiteLoader:
             raise ValueError("Cannot load empty DataFrame")
 
         logger.info(
-            f"Loading {len(dataframe)} records to "
-            f"{self.table_name} in {self.database_path}"
+            "Loading %d records to %s in %s",
+            len(dataframe), self.table_name, self.database_path
         )
 
         try:
@@ -67,7 +79,7 @@ class SQLiteLoader:
             dataframe.to_sql(
                 self.table_name,
                 conn,
-                if_exists=self.if_exists,
+                if_exists=if_exists or self.if_exists,
                 index=False
             )
 
@@ -75,17 +87,100 @@ class SQLiteLoader:
             conn.close()
 
             logger.info(
-                f"Successfully loaded {len(dataframe)} records "
-                f"to {self.table_name}"
+                "Successfully loaded %d records to %s",
+                len(dataframe), self.table_name
             )
 
             return len(dataframe)
 
         except sqlite3.Error as e:
-            logger.error(f"Database error: {e}")
+            logger.error("Database error: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error loading data: {e}")
+            logger.error("Error loading data: %s", e)
+            raise
+
+    def load_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        memory_manager: Optional[MemoryManager] = None
+    ) -> int:
+        """
+        Load a stream of DataFrames over one connection.
+
+        The first non-empty chunk honours ``if_exists``; later chunks are
+        appended.
+
+        Args:
+            chunks: DataFrames to load.
+            memory_manager: Optional manager whose current chunk size is
+                            used as the insert batch size.
+
+        Returns:
+            Number of rows loaded.
+
+        Raises:
+            ValueError: If there are no rows to load.
+            sqlite3.Error: If database operation fails.
+        """
+        total = 0
+        if_exists = self.if_exists
+
+        conn = sqlite3.connect(str(self.database_path))
+        try:
+            for chunk in chunks:
+                if chunk.empty:
+                    continue
+
+                chunk.to_sql(
+                    self.table_name,
+                    conn,
+                    if_exists=if_exists,
+                    index=False,
+                    chunksize=(
+                        memory_manager.chunk_rows if memory_manager else None
+                    )
+                )
+                if_exists = 'append'
+                total += len(chunk)
+                self._chunk_log.log(
+                    'load', len(chunk),
+                    "Loaded %d records to %s", len(chunk), self.table_name
+                )
+
+            if total == 0:
+                raise ValueError("Cannot load empty DataFrame")
+
+            conn.commit()
+
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
+            raise
+        finally:
+            conn.close()
+
+        logger.info(
+            "Successfully loaded %d records to %s", total, self.table_name
+        )
+        return total
+
+    def drop_table(self) -> None:
+        """
+        Drop the target table if it exists.
+
+        Raises:
+            sqlite3.Error: If database operation fails.
+        """
+        try:
+            conn = sqlite3.connect(str(self.database_path))
+            conn.execute(f'DROP TABLE IF EXISTS "{self.table_name}"')
+            conn.commit()
+            conn.close()
+
+            logger.info("Dropped table %s", self.table_name)
+
+        except sqlite3.Error as e:
+            logger.error("Database error: %s", e)
             raise
 
     def verify_load(self) -> int:
@@ -108,12 +203,10 @@ class SQLiteLoader:
 
             conn.close()
 
-            logger.info(
-                f"Verified {count} records in {self.table_name}"
-            )
+            logger.info("Verified %d records in %s", count, self.table_name)
 
             return count
 
         except sqlite3.Error as e:
-            logger.error(f"Verification error: {e}")
+            logger.error("Verification error: %s", e)
             raise
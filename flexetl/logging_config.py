@@ -0,0 +1,171 @@
+"""
+Logging configuration for FlexETL.
+
+Provides a non-blocking logging setup where pipeline threads only merge
+message arguments and enqueue log records while a background listener
+performs formatting and I/O, plus a sampled logger for high-frequency
+per-chunk events.
+"""
+
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+def setup_logging(
+    log_file: Optional[str] = None,
+    level: int = logging.INFO
+) -> logging.handlers.QueueListener:
+    """
+    Configure root logging to go through a queue and background listener.
+
+    Existing root handlers are removed and closed. Message arguments are
+    still merged in the logging thread, so mutable arguments are rendered
+    as they were when logged.
+
+    Args:
+        log_file: Optional path of a file to append log output to.
+        level: Root logger level.
+
+    Returns:
+        The started QueueListener. Pass it to ``shutdown_logging()``
+        before exiting to flush pending records and close the handlers.
+    """
+    formatter = logging.Formatter(LOG_FORMAT)
+
+    handlers: List[logging.Handler] = [logging.StreamHandler(sys.stdout)]
+    if log_file:
+        log_path = Path(log_file)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handlers.append(logging.FileHandler(log_path, mode='a'))
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+        existing.close()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener.start()
+    return listener
+
+
+def shutdown_logging(listener: logging.handlers.QueueListener) -> None:
+    """
+    Flush and tear down logging configured by ``setup_logging()``.
+
+    Stops the listener, closes its handlers, and removes the root
+    handlers that feed its queue so later records are not lost in a
+    queue nobody reads.
+
+    Args:
+        listener: Listener returned by ``setup_logging()``.
+    """
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        if (isinstance(existing, logging.handlers.QueueHandler)
+                and existing.queue is listener.queue):
+            root.removeHandler(existing)
+            existing.close()
+
+
+class SampledLogger:
+    """
+    Rate-limited logger for events that fire once per chunk.
+
+    The first occurrence of each event is logged, then only every
+    ``every``-th one. Counts and totals are accumulated for all
+    occurrences so that ``summary()`` can report them at the end of a
+    stage, keeping logging cost flat as the number of chunks grows.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        every: int = 1000,
+        level: int = logging.INFO
+    ) -> None:
+        """
+        Initialize sampled logger.
+
+        Args:
+            logger: Underlying logger to emit messages to.
+            every: Log one in every ``every`` occurrences of an event.
+            level: Level used for sampled messages and summaries.
+
+        Raises:
+            ValueError: If ``every`` is less than 1.
+        """
+        if every < 1:
+            raise ValueError(f"Sampling interval must be >= 1: {every}")
+
+        self.logger = logger
+        self.every = every
+        self.level = level
+        self._lock = threading.Lock()
+        self._calls: Dict[str, int] = defaultdict(int)
+        self._totals: Dict[str, int] = defaultdict(int)
+
+    def log(self, event: str, amount: int, msg: str, *args: Any) -> None:
+        """
+        Record an event occurrence and log it if it is sampled.
+
+        Args:
+            event: Event key used for sampling and the summary.
+            amount: Quantity to add to the event total (e.g. rows removed).
+            msg: Lazy %-style log message.
+            *args: Arguments for ``msg``.
+        """
+        with self._lock:
+            self._calls[event] += 1
+            self._totals[event] += amount
+            calls = self._calls[event]
+
+        sampled = (calls - 1) % self.every == 0
+        if sampled and self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, msg, *args)
+
+    def summary(self, stage: str) -> Dict[str, int]:
+        """
+        Log per-event totals for a stage and reset the counters.
+
+        Args:
+            stage: Stage name to include in the summary messages.
+
+        Returns:
+            Dict mapping event keys to accumulated totals.
+        """
+        with self._lock:
+            calls = dict(self._calls)
+            totals = dict(self._totals)
+            self._calls.clear()
+            self._totals.clear()
+
+        for event in sorted(calls):
+            self.logger.log(
+                self.level,
+                "%s summary: %s ran %d times, total %d",
+                stage, event, calls[event], totals[event]
+            )
+
+        return totals
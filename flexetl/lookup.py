@@ -0,0 +1,303 @@
+"""
+Dimension lookup module for FlexETL.
+
+Loads a dimension table from CSV or SQLite once, indexes it by key, and
+enriches fact chunks with a vectorized broadcast hash join. The index is
+reused across chunks, optionally cached on disk across runs, and rebuilt
+when the source file changes.
+"""
+
+import hashlib
+import logging
+import os
+import pickle  # nosec B403 - only reads cache files this module wrote
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+import numpy as np
+import pandas as pd
+
+from flexetl.logging_config import SampledLogger
+
+
+logger = logging.getLogger(__name__)
+
+
+class DimensionLookup:
+    """Index a dimension table by key for per-chunk broadcast joins."""
+
+    def __init__(
+        self,
+        source_path: str,
+        key_column: str,
+        value_columns: List[str],
+        table_name: Optional[str] = None,
+        cache_dir: Optional[str] = None
+    ) -> None:
+        """
+        Initialize dimension lookup.
+
+        Args:
+            source_path: Path to a CSV file, or to a SQLite database when
+                         table_name is given.
+            key_column: Column holding the unique dimension key.
+            value_columns: Columns to add to fact rows.
+            table_name: SQLite table to read. If None, source_path is
+                        read as CSV.
+            cache_dir: Optional directory for caching the index between
+                       runs.
+
+        Raises:
+            ValueError: If value_columns is empty.
+        """
+        if not value_columns:
+            raise ValueError("At least one value column is required")
+
+        self.source_path = Path(source_path)
+        self.key_column = key_column
+        self.value_columns = value_columns
+        self.table_name = table_name
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.rows_looked_up = 0
+        self.rows_unmatched = 0
+        self._chunk_log = SampledLogger(logger)
+
+        self._signature: Optional[Tuple[Any, ...]] = None
+        self._keys: Optional[pd.Index] = None
+        self._values: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, keys: pd.Series) -> pd.DataFrame:
+        """
+        Look up dimension values for each fact key.
+
+        Args:
+            keys: Fact key column. Categorical keys are resolved once per
+                  category rather than once per row.
+
+        Returns:
+            DataFrame aligned with ``keys`` holding the value columns,
+            with nulls where the key is not in the dimension.
+
+        Raises:
+            FileNotFoundError: If the source does not exist.
+            ValueError: If the dimension is invalid.
+        """
+        with self._lock:
+            index, values_by_column = self._refresh()
+
+        if isinstance(keys.dtype, pd.CategoricalDtype):
+            # A trailing -1 maps null codes (-1) to "not found", even
+            # when there are no categories.
+            category_positions = np.append(
+                index.get_indexer(keys.cat.categories), -1
+            )
+            positions = category_positions[keys.cat.codes.to_numpy()]
+        else:
+            positions = index.get_indexer(pd.Index(keys))
+
+        missing = positions < 0
+        unmatched = int(missing.sum())
+        with self._lock:
+            self.rows_looked_up += len(keys)
+            self.rows_unmatched += unmatched
+        self._chunk_log.log(
+            'lookup', unmatched,
+            "%d of %d keys not found in %s",
+            unmatched, len(keys), self.source_path
+        )
+
+        safe_positions = np.where(missing, 0, positions)
+        result = pd.DataFrame(index=keys.index)
+        for column, values in values_by_column.items():
+            taken = pd.Series(values[safe_positions], index=keys.index)
+            result[column] = taken.where(~missing) if unmatched else taken
+
+        return cast(pd.DataFrame, result)
+
+    def log_summary(self, stage: str = 'lookup') -> Dict[str, int]:
+        """
+        Log lookup totals.
+
+        Args:
+            stage: Stage name to include in the summary messages.
+
+        Returns:
+            Dict with rows looked up and rows without a match.
+        """
+        logger.info(
+            "%s: %d of %d keys not found in %s",
+            stage, self.rows_unmatched, self.rows_looked_up,
+            self.source_path
+        )
+        return {
+            'rows_looked_up': self.rows_looked_up,
+            'rows_unmatched': self.rows_unmatched
+        }
+
+    def _source_signature(self) -> Tuple[Any, ...]:
+        """Identify the source contents by file metadata and settings."""
+        if not self.source_path.exists():
+            raise FileNotFoundError(
+                f"Dimension source not found: {self.source_path}"
+            )
+
+        stat = self.source_path.stat()
+        signature: Tuple[Any, ...] = (
+            str(self.source_path.resolve()), stat.st_mtime_ns, stat.st_size,
+            self.table_name, self.key_column, tuple(self.value_columns)
+        )
+
+        if self.table_name is not None:
+            # In WAL mode committed writes land in the -wal file until a
+            # checkpoint copies them into the database file.
+            wal_path = self.source_path.with_name(
+                self.source_path.name + '-wal'
+            )
+            try:
+                wal_stat = wal_path.stat()
+            except FileNotFoundError:
+                signature += (None,)
+            else:
+                signature += ((wal_stat.st_mtime_ns, wal_stat.st_size),)
+
+        return signature
+
+    def _refresh(self) -> Tuple[pd.Index, Dict[str, np.ndarray]]:
+        """Return the index, rebuilding it if the source has changed."""
+        signature = self._source_signature()
+        if signature == self._signature and self._keys is not None:
+            return self._keys, self._values
+
+        cached = self._read_cache(signature)
+        if cached is None:
+            dimension = self._load_dimension()
+            keys = pd.Index(dimension[self.key_column])
+            if keys.empty:
+                raise ValueError(
+                    f"Dimension source is empty: {self.source_path}"
+                )
+            if not keys.is_unique:
+                raise ValueError(
+                    f"Duplicate keys in dimension column: {self.key_column}"
+                )
+            values = {
+                column: dimension[column].to_numpy()
+                for column in self.value_columns
+            }
+            self._write_cache(signature, keys, values)
+        else:
+            keys, values = cached
+
+        self._signature = signature
+        self._keys = keys
+        self._values = values
+        return keys, values
+
+    def _load_dimension(self) -> pd.DataFrame:
+        """Read the key and value columns from the source."""
+        columns = [self.key_column] + self.value_columns
+        logger.info("Loading dimension from %s", self.source_path)
+
+        if self.table_name is None:
+            try:
+                dimension = pd.read_csv(self.source_path, usecols=columns)
+            except ValueError as e:
+                raise ValueError(
+                    f"Invalid dimension file {self.source_path}: {e}"
+                ) from e
+        else:
+            select = ', '.join(f'"{column}"' for column in columns)
+            query = f'SELECT {select} FROM "{self.table_name}"'  # nosec
+            conn = sqlite3.connect(str(self.source_path))
+            try:
+                dimension = pd.read_sql_query(query, conn)
+            finally:
+                conn.close()
+
+        logger.info(
+            "Loaded %d dimension rows from %s",
+            len(dimension), self.source_path
+        )
+        return dimension
+
+    def _cache_path(self) -> Optional[Path]:
+        """Return the cache file for this source, if caching is on."""
+        if self.cache_dir is None:
+            return None
+
+        source_id = '|'.join([
+            str(self.source_path.resolve()), str(self.table_name),
+            self.key_column, *self.value_columns
+        ])
+        digest = hashlib.sha1(
+            source_id.encode(), usedforsecurity=False
+        ).hexdigest()[:16]
+        return self.cache_dir / f"lookup_{digest}.pkl"
+
+    def _read_cache(
+        self,
+        signature: Tuple[Any, ...]
+    ) -> Optional[Tuple[pd.Index, Dict[str, np.ndarray]]]:
+        """
+        Load a cached index if it matches the source signature.
+
+        Unreadable caches (truncated, or written by other library
+        versions) are treated as a miss so the index is rebuilt.
+        """
+        cache_path = self._cache_path()
+        if cache_path is None or not cache_path.exists():
+            return None
+
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)  # nosec B301
+            cached_signature = cached['signature']
+            keys, values = cached['keys'], cached['values']
+        except (pickle.UnpicklingError, EOFError, AttributeError,
+                ImportError, KeyError, TypeError) as e:
+            logger.warning(
+                "Ignoring unreadable dimension cache %s: %s", cache_path, e
+            )
+            return None
+
+        if cached_signature != signature:
+            logger.info("Dimension cache %s is stale", cache_path)
+            return None
+
+        logger.info("Loaded dimension index from %s", cache_path)
+        return keys, values
+
+    def _write_cache(
+        self,
+        signature: Tuple[Any, ...],
+        keys: pd.Index,
+        values: Dict[str, np.ndarray]
+    ) -> None:
+        """
+        Store the index in the cache directory, if caching is on.
+
+        The cache is written to a temporary file and moved into place, so
+        readers never see a partly written file.
+        """
+        cache_path = self._cache_path()
+        if cache_path is None:
+            return
+
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=f'.{cache_path.name}.'
+        )
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(
+                    {'signature': signature, 'keys': keys, 'values': values},
+                    f
+                )
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
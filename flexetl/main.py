@@ -5,23 +5,22 @@ Phase 1: Basic ETL with hardcoded parameters for sales data aggregation.
 """
 
 import logging
+import os
 import sys
 from pathlib import Path
 
+import pandas as pd
+
+from flexetl.deduplicator import Deduplicator
 from flexetl.extractor import CSVExtractor
+from flexetl.logging_config import setup_logging, shutdown_logging
+from flexetl.lookup import DimensionLookup
 from flexetl.transformer import DataTransformer
 from flexetl.loader import SQLiteLoader
+from flexetl.scalability import MemoryManager
+from flexetl.validators import DataQualityChecker
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('output/pipeline.log', mode='a')
-    ]
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +31,8 @@ def main() -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    listener = setup_logging('output/pipeline.log')
+
     try:
         logger.info("=" * 60)
         logger.info("FlexETL Pipeline v0.1.0 - Phase 1 MVP")
@@ -39,36 +40,108 @@ def main() -> int:
 
         Path("output").mkdir(exist_ok=True)
 
-        logger.info("Step 1: Extract data from CSV")
+        logger.info("Step 1: Plan chunked extraction from CSV")
         extractor = CSVExtractor("data/sales_data.csv")
-        raw_data = extractor.extract()
-        logger.info(f"Extracted {len(raw_data)} records")
+        sample = extractor.sample()
+
+        budget_mb = os.environ.get('MEMORY_LIMIT_MB')
+        memory_manager = MemoryManager(
+            budget_mb=int(budget_mb) if budget_mb else None
+        )
+        memory_manager.estimate_row_bytes(sample)
+        memory_manager.plan()
 
         logger.info("Step 2: Transform data")
-        transformer = DataTransformer(raw_data)
+        checker = (
+            DataQualityChecker(
+                quarantine_loader=SQLiteLoader(
+                    database_path="output/sales.db",
+                    table_name="quarantine_sales_data",
+                    if_exists="replace"
+                )
+            )
+            .add_not_null(['date', 'product_id', 'quantity', 'unit_price'])
+            .add_range('quantity', min_value=1)
+            .add_range('unit_price', min_value=0.01)
+            .add_regex('product_id', r'P\d+')
+            .add_date('date')
+        )
+        checker.reset_quarantine()
+
+        # The sales data has no transaction ID, so identical lines may be
+        # separate sales. Deduplicate only on a configured natural key.
+        dedup_keys = os.environ.get('DEDUP_KEY_COLUMNS')
+        deduplicator = (
+            Deduplicator(
+                key_columns=[
+                    column.strip() for column in dedup_keys.split(',')
+                ]
+            )
+            if dedup_keys else None
+        )
 
-        transformed_data = (
-            transformer
-            .filter_nulls(['product_id', 'quantity', 'unit_price'])
-            .filter_by_value('quantity', '>', 0)
-            .calculate_revenue('quantity', 'unit_price', 'revenue')
+        products = DimensionLookup(
+            "data/products.csv",
+            key_column='product_id',
+            value_columns=['category', 'unit_cost'],
+            cache_dir="output/cache"
         )
 
-        result_df = transformed_data.get_result()
+        group_by = ['date', 'product_id', 'product_name']
+
+        def transform_chunk(transformer: DataTransformer) -> DataTransformer:
+            transformer = transformer.validate(checker)
+            if deduplicator is not None:
+                transformer = transformer.deduplicate(deduplicator)
+            return (
+                transformer
+                .calculate_revenue('quantity', 'unit_price', 'revenue')
+                .enrich(products, 'product_id')
+                .calculate_margin('revenue', 'quantity', 'unit_cost',
+                                  'margin')
+                .aggregate(
+                    group_by=group_by,
+                    aggregations={
+                        'total_quantity': 'sum(quantity)',
+                        'total_revenue': 'sum(revenue)',
+                        'total_margin': 'sum(margin)'
+                    }
+                )
+            )
+
+        partials = list(
+            DataTransformer.map_chunks(
+                extractor.extract_chunks(memory_manager=memory_manager),
+                transform_chunk,
+                memory_manager
+            )
+        )
+
+        checker.flush()
+        checker.log_summary('Step 2')
+        if deduplicator is not None:
+            deduplicator.log_summary('Step 2')
+        products.log_summary('Step 2')
+        memory_manager.log_summary('Step 2')
 
+        # Per-chunk sums are combined into the final daily totals.
         aggregated = (
-            DataTransformer(result_df)
+            DataTransformer(pd.concat(partials, ignore_index=True))
             .aggregate(
-                group_by=['date', 'product_id', 'product_name'],
+                group_by=group_by,
                 aggregations={
-                    'total_quantity': 'sum(quantity)',
-                    'total_revenue': 'sum(revenue)'
+                    'total_quantity': 'sum(total_quantity)',
+                    'total_revenue': 'sum(total_revenue)',
+                    'total_margin': 'sum(total_margin)'
                 }
             )
             .get_result()
         )
 
-        logger.info(f"Transformed to {len(aggregated)} aggregated records")
+        DataTransformer.log_summary('Step 2')
+        logger.info(
+            "Transformed to %d aggregated records", len(aggregated)
+        )
 
         logger.info("Step 3: Load data to SQLite")
         loader = SQLiteLoader(
@@ -77,30 +150,41 @@ def main() -> int:
             if_exists="replace"
         )
 
-        rows_loaded = loader.load(aggregated)
+        rows_loaded = loader.load_chunks(
+            [aggregated], memory_manager=memory_manager
+        )
 
         verified_count = loader.verify_load()
 
+        records_processed = checker.rows_checked
+        records_transformed = (
+            records_processed
+            - checker.rows_rejected
+            - (deduplicator.duplicates_removed if deduplicator else 0)
+        )
+
         logger.info("=" * 60)
         logger.info("Pipeline completed successfully!")
-        logger.info(f"Records processed: {len(raw_data)}")
-        logger.info(f"Records after transformation: {len(result_df)}")
-        logger.info(f"Aggregated records: {len(aggregated)}")
-        logger.info(f"Records loaded: {rows_loaded}")
-        logger.info(f"Records verified: {verified_count}")
+        logger.info("Records processed: %d", records_processed)
+        logger.info("Records after transformation: %d", records_transformed)
+        logger.info("Aggregated records: %d", len(aggregated))
+        logger.info("Records loaded: %d", rows_loaded)
+        logger.info("Records verified: %d", verified_count)
         logger.info("=" * 60)
 
         return 0
 
     except FileNotFoundError as e:
-        logger.error(f"File not found: {e}")
+        logger.error("File not found: %s", e)
         return 1
     except ValueError as e:
-        logger.error(f"Validation error: {e}")
+        logger.error("Validation error: %s", e)
         return 1
     except Exception as e:
-        logger.exception(f"Pipeline failed with error: {e}")
+        logger.exception("Pipeline failed with error: %s", e)
         return 1
+    finally:
+        shutdown_logging(listener)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,9 @@
+"""
+Scalability helpers for FlexETL.
+
+Phase 8: Memory-aware chunk sizing and parallelism for large datasets.
+"""
+
+from flexetl.scalability.memory_manager import MemoryManager
+
+__all__ = ['MemoryManager']
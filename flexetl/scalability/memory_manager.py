@@ -0,0 +1,391 @@
+"""
+Memory budget management for FlexETL.
+
+Estimates the in-memory size of rows from a sample, derives a memory
+budget from configuration and the container's cgroup limit, and picks a
+chunk size and worker count that fit in it. While the pipeline runs, the
+process RSS is checked before each chunk is read so chunks can shrink
+when memory gets close to the limit, and reading can pause while other
+chunks that could free memory are still in flight.
+"""
+
+import gc
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pandas as pd
+
+from flexetl.logging_config import SampledLogger
+
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+DEFAULT_BUDGET_MB = 2048
+
+CGROUP_ROOT = Path('/sys/fs/cgroup')
+
+# cgroup v1 reports "no limit" as a very large page-aligned number.
+_CGROUP_UNLIMITED = 1 << 60
+
+
+def read_cgroup_memory_limit(root: Path = CGROUP_ROOT) -> Optional[int]:
+    """
+    Read the container memory limit from cgroup v2 or v1.
+
+    Args:
+        root: Mount point of the cgroup filesystem.
+
+    Returns:
+        Limit in bytes, or None if there is no limit or no cgroup.
+    """
+    for path in (root / 'memory.max',
+                 root / 'memory' / 'memory.limit_in_bytes'):
+        try:
+            text = path.read_text().strip()
+        except OSError:
+            continue
+
+        if text == 'max':
+            return None
+        try:
+            limit = int(text)
+        except ValueError:
+            return None
+        return None if limit >= _CGROUP_UNLIMITED else limit
+
+    return None
+
+
+def read_cgroup_cpu_limit(root: Path = CGROUP_ROOT) -> Optional[int]:
+    """
+    Read the container CPU quota from cgroup v2 or v1.
+
+    Args:
+        root: Mount point of the cgroup filesystem.
+
+    Returns:
+        Number of CPUs the quota allows (rounded up), or None if there is
+        no quota or no cgroup.
+    """
+    try:
+        quota, period = (root / 'cpu.max').read_text().split()[:2]
+        if quota == 'max':
+            return None
+        return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+
+    try:
+        quota_us = int((root / 'cpu' / 'cpu.cfs_quota_us').read_text())
+        period_us = int((root / 'cpu' / 'cpu.cfs_period_us').read_text())
+    except (OSError, ValueError):
+        return None
+    if quota_us <= 0 or period_us <= 0:
+        return None
+    return max(1, math.ceil(quota_us / period_us))
+
+
+def current_rss() -> Optional[int]:
+    """
+    Return the resident set size of this process.
+
+    Returns:
+        RSS in bytes, or None where /proc is not available.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return resident_pages * os.sysconf('SC_PAGE_SIZE')
+
+
+def _physical_memory() -> Optional[int]:
+    """Return total physical memory in bytes, if the OS reports it."""
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def _available_cpus() -> int:
+    """Return CPUs usable by this process, honouring cgroup quotas."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+
+    quota = read_cgroup_cpu_limit()
+    return min(cpus, quota) if quota else cpus
+
+
+class MemoryManager:
+    """Size chunks and workers to fit a memory budget."""
+
+    CRITICAL_FRACTION = 0.95
+
+    def __init__(
+        self,
+        budget_mb: Optional[int] = None,
+        overhead_factor: float = 3.0,
+        min_chunk_rows: int = 1000,
+        max_chunk_rows: int = 1_000_000,
+        max_workers: Optional[int] = None,
+        high_watermark: float = 0.8,
+        backpressure_timeout: float = 30.0
+    ) -> None:
+        """
+        Initialize memory manager.
+
+        Args:
+            budget_mb: Memory budget in MB. The effective budget is the
+                       smallest of this, the cgroup limit and physical
+                       memory; 2048 MB if none is known.
+            overhead_factor: Peak memory per chunk row relative to its
+                             typed size, covering copies made while
+                             transforming.
+            min_chunk_rows: Smallest chunk size to use.
+            max_chunk_rows: Largest chunk size to use.
+            max_workers: Upper bound on parallel workers. If None, uses
+                         the number of available CPUs.
+            high_watermark: Fraction of the budget that chunks are
+                            planned to fit in and above which chunks
+                            shrink.
+            backpressure_timeout: Seconds to wait for in-flight chunks to
+                                  free memory before reading a chunk
+                                  when RSS is near the budget. After
+                                  one timeout, later reads no longer
+                                  wait.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if budget_mb is not None and budget_mb <= 0:
+            raise ValueError(f"Memory budget must be > 0: {budget_mb}")
+        if not 1 <= min_chunk_rows <= max_chunk_rows:
+            raise ValueError(
+                f"Invalid chunk bounds: {min_chunk_rows}, {max_chunk_rows}"
+            )
+        if not 0 < high_watermark < self.CRITICAL_FRACTION:
+            raise ValueError(
+                f"High watermark must be between 0 and "
+                f"{self.CRITICAL_FRACTION}: {high_watermark}"
+            )
+
+        limits = [
+            limit for limit in (
+                budget_mb * MB if budget_mb is not None else None,
+                read_cgroup_memory_limit(),
+                _physical_memory()
+            )
+            if limit
+        ]
+        self.budget_bytes = min(limits) if limits else DEFAULT_BUDGET_MB * MB
+
+        self.overhead_factor = overhead_factor
+        self.min_chunk_rows = min_chunk_rows
+        self.max_chunk_rows = max_chunk_rows
+        self.max_workers = max_workers
+        self.high_watermark = high_watermark
+        self.backpressure_timeout = backpressure_timeout
+
+        self.row_bytes: Optional[float] = None
+        self.workers = 1
+        self.chunk_rows = min(max(100_000, min_chunk_rows), max_chunk_rows)
+        self._planned_chunk_rows = self.chunk_rows
+        self._in_flight = 0
+        self._backpressure_expired = False
+        self._lock = threading.Lock()
+        self._chunk_done = threading.Condition(self._lock)
+        self._chunk_log = SampledLogger(logger)
+        self._warning_log = SampledLogger(logger, level=logging.WARNING)
+
+    def estimate_row_bytes(self, sample: pd.DataFrame) -> float:
+        """
+        Estimate in-memory bytes per row from a typed sample.
+
+        Args:
+            sample: Sample rows as they will be read (already typed).
+
+        Returns:
+            Estimated bytes per row.
+
+        Raises:
+            ValueError: If the sample is empty.
+        """
+        if sample.empty:
+            raise ValueError("Cannot estimate row size from empty sample")
+
+        total = sample.memory_usage(index=True, deep=True).sum()
+        self.row_bytes = float(total) / len(sample)
+
+        logger.info(
+            "Estimated %.0f bytes per row from %d sample rows",
+            self.row_bytes, len(sample)
+        )
+        return self.row_bytes
+
+    def plan(self, row_bytes: Optional[float] = None) -> Tuple[int, int]:
+        """
+        Pick chunk size and worker count that fit the budget.
+
+        Each worker holds one chunk at a time and one more is being read,
+        so the memory left under the high watermark after the current
+        RSS is split across ``workers + 1`` chunks. Workers are reduced
+        before chunks fall below ``min_chunk_rows``.
+
+        Args:
+            row_bytes: Bytes per row. If None, uses the last estimate.
+
+        Returns:
+            Tuple of (chunk_rows, workers).
+
+        Raises:
+            ValueError: If the row size is unknown.
+        """
+        row_bytes = row_bytes or self.row_bytes
+        if not row_bytes:
+            raise ValueError(
+                "Row size unknown; call estimate_row_bytes() first"
+            )
+
+        baseline = current_rss() or 0
+        usable = self.budget_bytes * self.high_watermark - baseline
+        bytes_per_row = row_bytes * self.overhead_factor
+
+        workers = _available_cpus()
+        if self.max_workers:
+            workers = min(workers, self.max_workers)
+
+        while True:
+            rows = int(max(usable, 0) / (workers + 1) / bytes_per_row)
+            if rows >= self.min_chunk_rows or workers == 1:
+                break
+            workers -= 1
+
+        with self._lock:
+            self.workers = workers
+            self.chunk_rows = min(
+                max(rows, self.min_chunk_rows), self.max_chunk_rows
+            )
+            self._planned_chunk_rows = self.chunk_rows
+
+        logger.info(
+            "Memory budget %d MB: chunk size %d rows, %d workers",
+            self.budget_bytes // MB, self.chunk_rows, self.workers
+        )
+        return self.chunk_rows, self.workers
+
+    def chunk_started(self) -> None:
+        """Record that a chunk has been handed to a worker."""
+        with self._lock:
+            self._in_flight += 1
+
+    def chunk_finished(self) -> None:
+        """Record that a worker finished a chunk and wake any waiters."""
+        with self._lock:
+            self._in_flight -= 1
+            self._chunk_done.notify_all()
+
+    def next_chunk_rows(self) -> int:
+        """
+        Return the size for the next chunk, adapting to current RSS.
+
+        Above the high watermark the chunk size is halved. Near the
+        budget this also waits for in-flight chunks to finish and free
+        memory (backpressure); with nothing in flight it only shrinks.
+        Once RSS falls well below the watermark the size grows back
+        towards the planned value.
+
+        Returns:
+            Number of rows to read for the next chunk.
+        """
+        rss = current_rss()
+        if rss is None:
+            return self.chunk_rows
+
+        high = self.budget_bytes * self.high_watermark
+        if rss > self.budget_bytes * self.CRITICAL_FRACTION:
+            rss = self._wait_for_memory(high, rss)
+
+        with self._lock:
+            if rss > high and self.chunk_rows > self.min_chunk_rows:
+                self.chunk_rows = max(
+                    -(-self.chunk_rows // 2), self.min_chunk_rows
+                )
+                self._chunk_log.log(
+                    'shrink', 1,
+                    "RSS %d MB above watermark, chunk size now %d rows",
+                    rss // MB, self.chunk_rows
+                )
+            elif rss < high / 2:
+                self.chunk_rows = min(
+                    self.chunk_rows * 2, self._planned_chunk_rows
+                )
+            return self.chunk_rows
+
+    def log_summary(self, stage: str = 'memory') -> None:
+        """
+        Log chunk size adjustments and current memory use.
+
+        Args:
+            stage: Stage name to include in the summary messages.
+        """
+        self._chunk_log.summary(stage)
+        self._warning_log.summary(stage)
+        rss = current_rss()
+        logger.info(
+            "%s: RSS %s MB of %d MB budget, chunk size %d rows",
+            stage, rss // MB if rss is not None else 'unknown',
+            self.budget_bytes // MB, self.chunk_rows
+        )
+
+    def _wait_for_memory(self, target: float, rss: int) -> int:
+        """
+        Wait for in-flight chunks to free memory, up to the timeout.
+
+        Freed memory is often not returned to the OS, so RSS may not drop
+        at all. Returns at once when no other chunk is in flight or an
+        earlier wait already timed out.
+        """
+        with self._lock:
+            if self._in_flight == 0 or self._backpressure_expired:
+                return rss
+            in_flight = self._in_flight
+
+        self._chunk_log.log(
+            'backpressure', 1,
+            "RSS near %d MB budget, waiting for %d in-flight chunks",
+            self.budget_bytes // MB, in_flight
+        )
+
+        deadline = time.monotonic() + self.backpressure_timeout
+        while True:
+            with self._lock:
+                remaining = deadline - time.monotonic()
+                if self._in_flight and remaining > 0:
+                    self._chunk_done.wait(remaining)
+                in_flight = self._in_flight
+
+            gc.collect()
+            rss = current_rss() or 0
+            if rss <= target or in_flight == 0:
+                return rss
+            if time.monotonic() >= deadline:
+                break
+
+        with self._lock:
+            self._backpressure_expired = True
+        self._warning_log.log(
+            'backpressure_timeout', 1,
+            "RSS still %d MB after %.0fs, no longer waiting for memory",
+            rss // MB, self.backpressure_timeout
+        )
+        return rss
@@ -6,25 +6,92 @@ aggregation, and cleaning operations.
 """
 
 import logging
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, List, Optional
 
 import pandas as pd
 
+from flexetl.deduplicator import Deduplicator
+from flexetl.logging_config import SampledLogger
+from flexetl.lookup import DimensionLookup
+from flexetl.scalability import MemoryManager
+from flexetl.validators import DataQualityChecker
+
 
 logger = logging.getLogger(__name__)
 
+# Filters and calculations run once per chunk, so their messages are
+# sampled and reported in full by DataTransformer.log_summary().
+chunk_log = SampledLogger(logger)
+
 
 class DataTransformer:
     """Transform data using Pandas operations."""
 
-    def __init__(self, dataframe: pd.DataFrame) -> None:
+    def __init__(self, dataframe: pd.DataFrame, copy: bool = True) -> None:
         """
         Initialize transformer with a DataFrame.
 
         Args:
             dataframe: Input DataFrame to transform.
+            copy: Copy the input so the caller's DataFrame is not
+                  modified. Chunks owned by the pipeline can skip the
+                  copy to halve peak memory.
+        """
+        self.df = dataframe.copy() if copy else dataframe
+
+    @staticmethod
+    def map_chunks(
+        chunks: Iterable[pd.DataFrame],
+        transform: Callable[['DataTransformer'], 'DataTransformer'],
+        memory_manager: Optional[MemoryManager] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Apply a transformation chain to each chunk, in parallel if allowed.
+
+        Uses the memory manager's worker count. At most that many chunks
+        are in flight, so a chunk is only read from ``chunks`` once an
+        earlier result has been consumed. In-flight chunks are reported
+        to the memory manager for backpressure. Results keep input order.
+
+        Args:
+            chunks: Input chunks, e.g. from an extractor's
+                    ``extract_chunks()``. The chunks are not copied.
+            transform: Function applying transformations to a
+                       DataTransformer and returning it.
+            memory_manager: Optional manager providing the worker count.
+
+        Yields:
+            Transformed DataFrame for each chunk.
         """
-        self.df = dataframe.copy()
+        def run(chunk: pd.DataFrame) -> pd.DataFrame:
+            return transform(DataTransformer(chunk, copy=False)).get_result()
+
+        if memory_manager is None or memory_manager.workers <= 1:
+            for chunk in chunks:
+                yield run(chunk)
+            return
+
+        manager = memory_manager
+        workers = manager.workers
+
+        def run_tracked(chunk: pd.DataFrame) -> pd.DataFrame:
+            try:
+                return run(chunk)
+            finally:
+                manager.chunk_finished()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: Deque['Future[pd.DataFrame]'] = deque()
+            for chunk in chunks:
+                # Counted before submitting so the next read sees it.
+                manager.chunk_started()
+                pending.append(executor.submit(run_tracked, chunk))
+                if len(pending) >= workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
 
     def filter_nulls(
         self,
@@ -48,7 +115,10 @@ class DataTransformer:
 
         removed_count = initial_count - len(self.df)
         if removed_count > 0:
-            logger.info(f"Filtered {removed_count} rows with null values")
+            chunk_log.log(
+                'filter_nulls', removed_count,
+                "Filtered %d rows with null values", removed_count
+            )
 
         return self
 
@@ -93,13 +163,86 @@ class DataTransformer:
             raise ValueError(f"Invalid operator: {operator}")
 
         removed_count = initial_count - len(self.df)
-        logger.info(
-            f"Filtered {removed_count} rows where {column} "
-            f"{operator} {value}"
+        chunk_log.log(
+            'filter_by_value', removed_count,
+            "Filtered %d rows where %s %s %s",
+            removed_count, column, operator, value
         )
 
         return self
 
+    def validate(
+        self,
+        checker: DataQualityChecker
+    ) -> 'DataTransformer':
+        """
+        Remove rows that fail the checker's data quality rules.
+
+        Rejected rows are tagged with reason codes and quarantined by the
+        checker; call ``checker.flush()`` once all chunks are processed.
+
+        Args:
+            checker: Data quality checker holding the declared rules.
+
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            ValueError: If a rule refers to a missing column.
+        """
+        self.df = checker.validate(self.df)
+        return self
+
+    def deduplicate(
+        self,
+        deduplicator: Deduplicator
+    ) -> 'DataTransformer':
+        """
+        Remove rows whose keys were seen in this or an earlier chunk.
+
+        Args:
+            deduplicator: Deduplicator holding the seen key fingerprints.
+
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            ValueError: If a key column is missing.
+        """
+        self.df = deduplicator.deduplicate(self.df)
+        return self
+
+    def enrich(
+        self,
+        lookup: DimensionLookup,
+        key_column: str
+    ) -> 'DataTransformer':
+        """
+        Add dimension columns to each row by key (left join).
+
+        Rows are matched through the lookup's cached index, so the data
+        keeps its order and is not re-sorted per chunk. Columns for keys
+        missing from the dimension are null.
+
+        Args:
+            lookup: Dimension lookup holding the indexed table.
+            key_column: Column holding the dimension key.
+
+        Returns:
+            Self for method chaining.
+
+        Raises:
+            ValueError: If key_column doesn't exist.
+        """
+        if key_column not in self.df.columns:
+            raise ValueError(f"Column not found: {key_column}")
+
+        enriched = lookup.lookup(self.df[key_column])
+        for column in enriched.columns:
+            self.df[column] = enriched[column]
+
+        return self
+
     def aggregate(
         self,
         group_by: List[str],
@@ -123,8 +266,6 @@ class DataTransformer:
             if col not in self.df.columns:
                 raise ValueError(f"Grouping column not found: {col}")
 
-        logger.info(f"Aggregating data by {group_by}")
-
         agg_dict = {}
         for output_col, expr in aggregations.items():
             if expr.startswith('sum(') and expr.endswith(')'):
@@ -143,7 +284,10 @@ class DataTransformer:
 
         self.df = grouped
 
-        logger.info(f"Aggregated to {len(self.df)} rows")
+        chunk_log.log(
+            'aggregate', len(self.df),
+            "Aggregated by %s to %d rows", group_by, len(self.df)
+        )
         return self
 
     def calculate_revenue(
@@ -170,8 +314,45 @@ class DataTransformer:
 
         self.df[output_col] = self.df[quantity_col] * self.df[price_col]
 
-        logger.info(
-            f"Calculated {output_col} from {quantity_col} * {price_col}"
+        chunk_log.log(
+            'calculate_revenue', len(self.df),
+            "Calculated %s from %s * %s",
+            output_col, quantity_col, price_col
+        )
+        return self
+
+    def calculate_margin(
+        self,
+        revenue_col: str,
+        quantity_col: str,
+        cost_col: str,
+        output_col: str = 'margin'
+    ) -> 'DataTransformer':
+        """
+        Calculate margin as revenue - quantity * unit_cost.
+
+        Args:
+            revenue_col: Column name for revenue.
+            quantity_col: Column name for quantity.
+            cost_col: Column name for unit cost.
+            output_col: Name for the calculated margin column.
+
+        Returns:
+            Self for method chaining.
+        """
+        for column in (revenue_col, quantity_col, cost_col):
+            if column not in self.df.columns:
+                raise ValueError(f"Column not found: {column}")
+
+        self.df[output_col] = (
+            self.df[revenue_col]
+            - self.df[quantity_col] * self.df[cost_col]
+        )
+
+        chunk_log.log(
+            'calculate_margin', len(self.df),
+            "Calculated %s from %s - %s * %s",
+            output_col, revenue_col, quantity_col, cost_col
         )
         return self
 
@@ -183,3 +364,16 @@ class DataTransformer:
             Transformed DataFrame.
         """
         return self.df
+
+    @staticmethod
+    def log_summary(stage: str = 'transform') -> dict:
+        """
+        Log totals for sampled per-chunk events and reset them.
+
+        Args:
+            stage: Stage name to include in the summary messages.
+
+        Returns:
+            Dict mapping event keys to accumulated row counts.
+        """
+        return chunk_log.summary(stage)
@@ -0,0 +1,9 @@
+"""
+Data quality validation for FlexETL.
+
+Phase 4: Rule-based quality checks with quarantine of rejected rows.
+"""
+
+from flexetl.validators.quality_checker import DataQualityChecker
+
+__all__ = ['DataQualityChecker']
@@ -0,0 +1,333 @@
+"""
+Data quality checks for FlexETL.
+
+Evaluates declared rules as vectorized boolean masks over each chunk,
+tracks per-rule violation counts, and writes rejected rows tagged with
+reason codes to a quarantine table in batches.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple, cast
+
+import numpy as np
+import pandas as pd
+
+from flexetl.loader import SQLiteLoader
+from flexetl.logging_config import SampledLogger
+
+
+logger = logging.getLogger(__name__)
+
+REASON_COLUMN = 'reason_codes'
+
+Check = Callable[[pd.DataFrame], np.ndarray]
+
+
+class DataQualityChecker:
+    """Validate rows against declared rules and quarantine rejects."""
+
+    def __init__(
+        self,
+        quarantine_loader: Optional[SQLiteLoader] = None,
+        batch_size: int = 10000
+    ) -> None:
+        """
+        Initialize data quality checker.
+
+        Args:
+            quarantine_loader: Loader for the quarantine table. The first
+                               batch honours its ``if_exists`` setting,
+                               later batches are appended. The loader
+                               itself is not modified. If None,
+                               rejected rows are only counted.
+            batch_size: Number of rejected rows to buffer before writing
+                        them to the quarantine table.
+
+        Raises:
+            ValueError: If batch_size is less than 1.
+        """
+        if batch_size < 1:
+            raise ValueError(f"Batch size must be >= 1: {batch_size}")
+
+        self.quarantine_loader = quarantine_loader
+        self.batch_size = batch_size
+        self.rules: List[Tuple[str, str, Check]] = []
+        self.violation_counts: Dict[str, int] = defaultdict(int)
+        self.rows_checked = 0
+        self.rows_rejected = 0
+        self.rows_quarantined = 0
+        self._buffer: List[pd.DataFrame] = []
+        self._buffered_rows = 0
+        self._quarantine_written = False
+        self._chunk_log = SampledLogger(logger)
+        self._lock = threading.RLock()
+
+    def add_not_null(self, columns: List[str]) -> 'DataQualityChecker':
+        """
+        Reject rows with null values in the given columns.
+
+        Args:
+            columns: Column names that must not be null.
+
+        Returns:
+            Self for method chaining.
+        """
+        def not_null(column: str) -> Check:
+            def check(df: pd.DataFrame) -> np.ndarray:
+                return df[column].isna().to_numpy()
+            return check
+
+        for column in columns:
+            self._add_rule(f'not_null:{column}', column, not_null(column))
+        return self
+
+    def add_range(
+        self,
+        column: str,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None
+    ) -> 'DataQualityChecker':
+        """
+        Reject rows whose value is non-numeric or outside a range.
+
+        Bounds are inclusive. Null values are left to ``add_not_null``.
+
+        Args:
+            column: Column name to check.
+            min_value: Lowest allowed value, or None for no lower bound.
+            max_value: Highest allowed value, or None for no upper bound.
+
+        Returns:
+            Self for method chaining.
+        """
+        def check(df: pd.DataFrame) -> np.ndarray:
+            raw = df[column]
+            values = pd.to_numeric(raw, errors='coerce')
+            invalid = raw.notna() & values.isna()
+            if min_value is not None:
+                invalid |= values < min_value
+            if max_value is not None:
+                invalid |= values > max_value
+            return invalid.to_numpy()
+
+        self._add_rule(f'range:{column}', column, check)
+        return self
+
+    def add_regex(self, column: str, pattern: str) -> 'DataQualityChecker':
+        """
+        Reject rows whose value does not fully match a regex.
+
+        Null values are left to ``add_not_null``.
+
+        Args:
+            column: Column name to check.
+            pattern: Regular expression the whole value must match.
+
+        Returns:
+            Self for method chaining.
+        """
+        def check(df: pd.DataFrame) -> np.ndarray:
+            matched = df[column].astype('string').str.fullmatch(pattern)
+            return ~matched.fillna(True).to_numpy(dtype=bool)
+
+        self._add_rule(f'regex:{column}', column, check)
+        return self
+
+    def add_date(
+        self,
+        column: str,
+        date_format: str = '%Y-%m-%d',
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> 'DataQualityChecker':
+        """
+        Reject rows with unparseable dates or dates outside a window.
+
+        Bounds are inclusive. Null values are left to ``add_not_null``.
+
+        Args:
+            column: Column name to check.
+            date_format: strptime format the values must follow.
+            start: Earliest allowed date, or None for no lower bound.
+            end: Latest allowed date, or None for no upper bound.
+
+        Returns:
+            Self for method chaining.
+        """
+        start_ts = pd.Timestamp(start) if start is not None else None
+        end_ts = pd.Timestamp(end) if end is not None else None
+
+        def check(df: pd.DataFrame) -> np.ndarray:
+            raw = df[column]
+            parsed = pd.to_datetime(raw, format=date_format, errors='coerce')
+            invalid = raw.notna() & parsed.isna()
+            if start_ts is not None:
+                invalid |= parsed < start_ts
+            if end_ts is not None:
+                invalid |= parsed > end_ts
+            return invalid.to_numpy()
+
+        self._add_rule(f'date:{column}', column, check)
+        return self
+
+    def validate(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        """
+        Evaluate all rules on a chunk and return the rows that pass.
+
+        Rejected rows are tagged with their reason codes and buffered for
+        the quarantine table.
+
+        Args:
+            dataframe: Chunk to validate.
+
+        Returns:
+            DataFrame containing only the valid rows.
+
+        Raises:
+            ValueError: If a rule refers to a missing column.
+        """
+        for _, column, _ in self.rules:
+            if column not in dataframe.columns:
+                raise ValueError(f"Column not found: {column}")
+
+        if not self.rules or dataframe.empty:
+            with self._lock:
+                self.rows_checked += len(dataframe)
+            return dataframe
+
+        violations = np.column_stack(
+            [check(dataframe) for _, _, check in self.rules]
+        )
+        rejected = violations.any(axis=1)
+        counts = violations.sum(axis=0)
+        rejected_count = int(rejected.sum())
+
+        with self._lock:
+            self.rows_checked += len(dataframe)
+            self.rows_rejected += rejected_count
+            for (code, _, _), count in zip(self.rules, counts):
+                self.violation_counts[code] += int(count)
+
+        self._chunk_log.log(
+            'validate', rejected_count,
+            "Rejected %d of %d rows", rejected_count, len(dataframe)
+        )
+        if rejected_count == 0:
+            return dataframe
+
+        self._quarantine(
+            cast(pd.DataFrame, dataframe[rejected]), violations[rejected]
+        )
+        return cast(pd.DataFrame, dataframe[~rejected])
+
+    def flush(self) -> int:
+        """
+        Write buffered rejected rows to the quarantine table.
+
+        Returns:
+            Number of rows written.
+        """
+        with self._lock:
+            if not self._buffer:
+                return 0
+
+            buffered = self._buffer
+            self._buffer = []
+            self._buffered_rows = 0
+
+            if self.quarantine_loader is None:
+                return 0
+
+            batch = pd.concat(buffered, ignore_index=True)
+            written = self.quarantine_loader.load(
+                batch,
+                if_exists='append' if self._quarantine_written else None
+            )
+            self._quarantine_written = True
+            self.rows_quarantined += written
+            return written
+
+    def reset_quarantine(self) -> None:
+        """
+        Start a new run of the quarantine table.
+
+        Drops the table when the loader replaces existing data, so rows
+        from an earlier run do not remain when nothing is rejected.
+        Call this before validating the first chunk of a run.
+
+        Raises:
+            sqlite3.Error: If the table cannot be dropped.
+        """
+        with self._lock:
+            self._buffer = []
+            self._buffered_rows = 0
+            self._quarantine_written = False
+
+            if (self.quarantine_loader is not None
+                    and self.quarantine_loader.if_exists == 'replace'):
+                self.quarantine_loader.drop_table()
+
+    def log_summary(self, stage: str = 'validate') -> Dict[str, int]:
+        """
+        Log per-rule violation counts.
+
+        Args:
+            stage: Stage name to include in the summary messages.
+
+        Returns:
+            Dict mapping rule reason codes to violation counts.
+        """
+        logger.info(
+            "%s: rejected %d of %d rows, %d quarantined",
+            stage, self.rows_rejected, self.rows_checked,
+            self.rows_quarantined
+        )
+        for code, _, _ in self.rules:
+            logger.info(
+                "%s: %s violated by %d rows",
+                stage, code, self.violation_counts[code]
+            )
+        return dict(self.violation_counts)
+
+    def _add_rule(self, code: str, column: str, check: Check) -> None:
+        """Register a rule, keeping reason codes encodable as bits."""
+        if len(self.rules) >= 63:
+            raise ValueError("At most 63 rules are supported")
+        self.rules.append((code, column, check))
+
+    def _quarantine(
+        self,
+        rows: pd.DataFrame,
+        violations: np.ndarray
+    ) -> None:
+        """Tag rejected rows with reason codes and buffer them."""
+        if self.quarantine_loader is None:
+            return
+
+        # Each distinct combination of failed rules is labelled once,
+        # rather than building a reason string per row.
+        weights = np.left_shift(
+            np.int64(1), np.arange(violations.shape[1], dtype=np.int64)
+        )
+        patterns = violations.astype(np.int64) @ weights
+        unique, inverse = np.unique(patterns, return_inverse=True)
+        labels = np.array(
+            [
+                ';'.join(
+                    code for bit, (code, _, _) in enumerate(self.rules)
+                    if (int(pattern) >> bit) & 1
+                )
+                for pattern in unique
+            ],
+            dtype=object
+        )
+
+        tagged = rows.assign(**{REASON_COLUMN: labels[inverse]})
+        with self._lock:
+            self._buffer.append(tagged)
+            self._buffered_rows += len(tagged)
+
+            if self._buffered_rows >= self.batch_size:
+                self.flush()
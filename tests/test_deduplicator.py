@@ -0,0 +1,201 @@
+"""Unit tests for deduplicator module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from flexetl.deduplicator import BloomFilter, Deduplicator, FingerprintSet
+
+
+class TestFingerprintSet:
+    """Test FingerprintSet class."""
+
+    def test_add_and_contains(self):
+        """Test membership after several inserts."""
+        fingerprints = FingerprintSet()
+        for start in range(0, 1000, 100):
+            fingerprints.add(np.arange(start, start + 100, dtype=np.uint64))
+
+        probe = np.array([0, 999, 1000, 5000], dtype=np.uint64)
+
+        assert fingerprints.contains(probe).tolist() == [
+            True, True, False, False
+        ]
+        assert len(fingerprints) == 1000
+
+    def test_to_array_sorted(self):
+        """Test all fingerprints are returned sorted and unique."""
+        fingerprints = FingerprintSet(np.array([5, 1], dtype=np.uint64))
+        fingerprints.add(np.array([3, 1], dtype=np.uint64))
+
+        assert fingerprints.to_array().tolist() == [1, 3, 5]
+
+
+class TestBloomFilter:
+    """Test BloomFilter class."""
+
+    def test_no_false_negatives(self):
+        """Test every added fingerprint is reported present."""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        added = np.random.default_rng(0).integers(
+            0, 2**63, size=1000, dtype=np.uint64
+        )
+
+        bloom.add(added)
+
+        assert bloom.contains(added).all()
+
+    def test_false_positive_rate(self):
+        """Test false positives stay near the configured rate."""
+        rng = np.random.default_rng(1)
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        bloom.add(rng.integers(0, 2**63, size=1000, dtype=np.uint64))
+
+        probe = rng.integers(2**63, 2**64 - 1, size=10000, dtype=np.uint64)
+
+        assert bloom.contains(probe).mean() < 0.03
+
+    def test_invalid_error_rate(self):
+        """Test error when error rate is out of range."""
+        with pytest.raises(ValueError, match="Error rate"):
+            BloomFilter(capacity=10, error_rate=1.5)
+
+
+class TestDeduplicator:
+    """Test Deduplicator class."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample DataFrame with a repeated key."""
+        return pd.DataFrame({
+            'date': ['2026-02-01', '2026-02-01', '2026-02-01'],
+            'product_id': ['P001', 'P002', 'P001'],
+            'quantity': [2, 5, 2]
+        })
+
+    @pytest.mark.parametrize('mode', ['exact', 'bloom'])
+    def test_dedup_within_and_across_chunks(self, sample_data, mode):
+        """Test duplicates are removed within and across chunks."""
+        dedup = Deduplicator(['date', 'product_id'], mode=mode)
+
+        first = dedup.deduplicate(sample_data)
+        second = dedup.deduplicate(sample_data)
+
+        assert first['product_id'].tolist() == ['P001', 'P002']
+        assert second.empty
+        assert dedup.duplicates_removed == 4
+
+    @pytest.mark.parametrize(
+        'mode, file_name', [('exact', 'state.npy'), ('bloom', 'state.npz')]
+    )
+    def test_state_persisted_across_runs(
+        self, tmp_path, sample_data, mode, file_name
+    ):
+        """Test saved fingerprints are honoured by a new instance."""
+        state_path = str(tmp_path / "state" / file_name)
+
+        first_run = Deduplicator(['product_id'], state_path, mode=mode)
+        first_run.deduplicate(sample_data.iloc[:1])
+        first_run.save_state()
+
+        second_run = Deduplicator(['product_id'], state_path, mode=mode)
+        result = second_run.deduplicate(sample_data)
+
+        assert result['product_id'].tolist() == ['P002']
+
+    def test_int_chunk_matches_float_chunk(self, tmp_path):
+        """Test a row matches when a later chunk reads a column as float."""
+        csv_path = tmp_path / "sales.csv"
+        csv_path.write_text(
+            "product_id,quantity\n"
+            "P001,2\n"
+            "P002,3\n"
+            "P001,2\n"
+            "P003,\n"
+        )
+        dedup = Deduplicator(['product_id', 'quantity'])
+
+        chunks = list(pd.read_csv(csv_path, chunksize=2))
+        assert chunks[0]['quantity'].dtype == np.int64
+        assert chunks[1]['quantity'].dtype == np.float64
+
+        kept = sum(len(dedup.deduplicate(chunk)) for chunk in chunks)
+
+        assert kept == 3
+        assert dedup.duplicates_removed == 1
+
+    def test_large_int64_keys_kept_distinct(self):
+        """Test int64 keys beyond 2**53 are not merged by float rounding."""
+        dedup = Deduplicator(['order_id'])
+        chunk = pd.DataFrame({'order_id': [
+            1234567890123456789, 1234567890123456790, 1234567890123456800
+        ]})
+
+        result = dedup.deduplicate(chunk)
+
+        assert len(result) == 3
+        assert dedup.duplicates_removed == 0
+
+    def test_fractional_floats_kept_distinct(self):
+        """Test non-integer floats hash as floats, whole ones as ints."""
+        dedup = Deduplicator(['quantity'])
+        floats = dedup.fingerprint(
+            pd.DataFrame({'quantity': [2.0, 2.5, None]})
+        )
+        ints = dedup.fingerprint(
+            pd.DataFrame({'quantity': pd.array([2, 3, None], dtype='Int64')})
+        )
+
+        assert len(set(floats)) == 3
+        assert floats[0] == ints[0]
+        assert floats[2] == ints[2]
+
+    def test_categorical_matches_object(self):
+        """Test categorical and nullable string keys match object keys."""
+        dedup = Deduplicator(['product_id'])
+        keys = ['P001', None]
+
+        fingerprints = [
+            dedup.fingerprint(pd.DataFrame({'product_id': column}))
+            for column in (
+                pd.Series(keys, dtype=object),
+                pd.Series(keys, dtype='category'),
+                pd.Series(keys, dtype='string')
+            )
+        ]
+
+        for other in fingerprints[1:]:
+            np.testing.assert_array_equal(fingerprints[0], other)
+
+    def test_failed_save_keeps_previous_state(
+        self, tmp_path, sample_data, monkeypatch
+    ):
+        """Test an interrupted save leaves the earlier state file intact."""
+        state_path = tmp_path / "state" / "seen.npy"
+        dedup = Deduplicator(['product_id'], str(state_path))
+        dedup.deduplicate(sample_data)
+        dedup.save_state()
+        saved = state_path.read_bytes()
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        dedup.deduplicate(pd.DataFrame({'product_id': ['P009']}))
+        monkeypatch.setattr(np, 'save', fail)
+        with pytest.raises(OSError, match="disk full"):
+            dedup.save_state()
+
+        assert state_path.read_bytes() == saved
+        assert list(state_path.parent.iterdir()) == [state_path]
+
+    def test_missing_key_column(self, sample_data):
+        """Test error when a key column is missing."""
+        dedup = Deduplicator(['invalid'])
+
+        with pytest.raises(ValueError, match="Column not found"):
+            dedup.deduplicate(sample_data)
+
+    def test_invalid_mode(self):
+        """Test error with invalid mode."""
+        with pytest.raises(ValueError, match="Invalid dedup mode"):
+            Deduplicator(['product_id'], mode='invalid')
@@ -1,8 +1,11 @@
 """Unit tests for extractor module."""
 
+import sqlite3
+
+import pandas as pd
 import pytest
 
-from flexetl.extractor import CSVExtractor
+from flexetl.extractor import CSVExtractor, SQLiteExtractor
 
 
 class TestCSVExtractor:
@@ -48,3 +51,141 @@ class TestCSVExtractor:
 
         with pytest.raises(ValueError, match="empty"):
             extractor.extract()
+
+
+class TestSQLiteExtractor:
+    """Test SQLiteExtractor class."""
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        """Create a SQLite database with a sales table."""
+        db_path = tmp_path / "staging.db"
+        conn = sqlite3.connect(str(db_path))
+        pd.DataFrame({
+            'product_id': ['P001', 'P002', 'P003', 'P004', 'P005'],
+            'quantity': [2, 0, 3, None, 1],
+            'unit_price': [100.0, 25.0, 75.0, 10.0, 50.0]
+        }).to_sql('sales', conn, index=False)
+        conn.close()
+        return db_path
+
+    def test_extract_all(self, database):
+        """Test extracting a whole table."""
+        df = SQLiteExtractor(str(database), 'sales').extract()
+
+        assert len(df) == 5
+        assert list(df.columns) == ['product_id', 'quantity', 'unit_price']
+
+    def test_extract_chunks(self, database):
+        """Test rows are streamed in batches."""
+        extractor = SQLiteExtractor(str(database), 'sales', batch_size=2)
+
+        chunks = list(extractor.extract_chunks())
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[2]['product_id'].tolist() == ['P005']
+
+    def test_column_and_predicate_pushdown(self, database):
+        """Test selected columns and filters are applied in SQL."""
+        df = (
+            SQLiteExtractor(str(database), 'sales', columns=['product_id'])
+            .filter_by_value('quantity', '>', 0)
+            .filter_by_value('unit_price', '<', 100)
+            .extract()
+        )
+
+        assert list(df.columns) == ['product_id']
+        assert df['product_id'].tolist() == ['P003', 'P005']
+
+    def test_not_equal_keeps_nulls(self, database):
+        """Test != keeps NULL rows like the pandas filter does."""
+        df = (
+            SQLiteExtractor(str(database), 'sales')
+            .filter_by_value('quantity', '!=', 0)
+            .extract()
+        )
+
+        assert df['product_id'].tolist() == ['P001', 'P003', 'P004', 'P005']
+
+    def test_split_rowid_ranges(self, database):
+        """Test partitions cover every row exactly once."""
+        extractor = (
+            SQLiteExtractor(str(database), 'sales')
+            .filter_by_value('quantity', '>', 0)
+        )
+
+        partitions = extractor.split(2)
+        rows = [
+            partition.extract()['product_id'].tolist()
+            for partition in partitions
+        ]
+
+        assert len(partitions) == 2
+        assert rows == [['P001', 'P003'], ['P005']]
+
+    def test_extract_no_rows(self, database):
+        """Test error when the query returns no rows."""
+        extractor = (
+            SQLiteExtractor(str(database), 'sales')
+            .filter_by_value('quantity', '>', 100)
+        )
+
+        with pytest.raises(ValueError, match="No rows"):
+            extractor.extract()
+
+    def test_database_not_found(self, tmp_path):
+        """Test error when the database file doesn't exist."""
+        extractor = SQLiteExtractor(str(tmp_path / "missing.db"), 'sales')
+
+        with pytest.raises(FileNotFoundError):
+            extractor.extract()
+        assert not (tmp_path / "missing.db").exists()
+
+    def test_invalid_operator(self, database):
+        """Test error with invalid operator."""
+        extractor = SQLiteExtractor(str(database), 'sales')
+
+        with pytest.raises(ValueError, match="Invalid operator"):
+            extractor.filter_by_value('quantity', 'invalid', 0)
+
+
+class TestCSVExtractorChunks:
+    """Test chunked CSV extraction."""
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        """Create a CSV file with five rows."""
+        csv_file = tmp_path / "test.csv"
+        csv_file.write_text(
+            "id,value\n" + "".join(f"{i},{i * 10}\n" for i in range(5))
+        )
+        return csv_file
+
+    def test_extract_chunks(self, csv_file):
+        """Test the file is streamed in fixed-size chunks."""
+        chunks = list(CSVExtractor(str(csv_file)).extract_chunks(2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert chunks[2]['id'].tolist() == [4]
+
+    def test_extract_chunks_from_memory_manager(self, csv_file):
+        """Test chunk sizes are taken from the memory manager."""
+        class FixedSizes:
+            sizes = iter([1, 3, 3, 3])
+
+            def next_chunk_rows(self):
+                return next(self.sizes)
+
+        chunks = list(
+            CSVExtractor(str(csv_file)).extract_chunks(
+                memory_manager=FixedSizes()
+            )
+        )
+
+        assert [len(chunk) for chunk in chunks] == [1, 3, 1]
+
+    def test_sample(self, csv_file):
+        """Test sampling reads only the first rows."""
+        sample = CSVExtractor(str(csv_file)).sample(rows=3)
+
+        assert len(sample) == 3
@@ -1,5 +1,7 @@
 """Unit tests for loader module."""
 
+import sqlite3
+
 import pandas as pd
 import pytest
 
@@ -119,3 +121,64 @@ class TestSQLiteLoader:
 
         assert db_path.exists()
         assert db_path.parent.exists()
+
+    def test_load_chunks(self, tmp_path, sample_data):
+        """Test chunks replace the table once and then append."""
+        db_path = tmp_path / "test.db"
+        loader = SQLiteLoader(
+            database_path=str(db_path),
+            table_name="test_table",
+            if_exists="replace"
+        )
+        loader.load(sample_data)
+
+        rows_loaded = loader.load_chunks(
+            [sample_data, pd.DataFrame(), sample_data.iloc[:1]]
+        )
+
+        assert rows_loaded == 3
+        assert loader.verify_load() == 3
+
+    def test_load_chunks_empty(self, tmp_path):
+        """Test error when no chunk has rows."""
+        loader = SQLiteLoader(
+            database_path=str(tmp_path / "test.db"),
+            table_name="test_table"
+        )
+
+        with pytest.raises(ValueError, match="empty DataFrame"):
+            loader.load_chunks([pd.DataFrame()])
+
+    def test_load_if_exists_override(self, tmp_path, sample_data):
+        """Test if_exists can be overridden per call."""
+        loader = SQLiteLoader(
+            database_path=str(tmp_path / "test.db"),
+            table_name="test_table",
+            if_exists="replace"
+        )
+
+        loader.load(sample_data)
+        loader.load(sample_data, if_exists='append')
+
+        assert loader.verify_load() == len(sample_data) * 2
+        assert loader.if_exists == 'replace'
+
+    def test_drop_table(self, tmp_path, sample_data):
+        """Test the target table is dropped and can be dropped again."""
+        db_path = tmp_path / "test.db"
+        loader = SQLiteLoader(
+            database_path=str(db_path),
+            table_name="test_table"
+        )
+        loader.load(sample_data)
+
+        loader.drop_table()
+        loader.drop_table()
+
+        conn = sqlite3.connect(str(db_path))
+        tables = conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'test_table'"
+        ).fetchall()
+        conn.close()
+
+        assert tables == []
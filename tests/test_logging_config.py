@@ -0,0 +1,133 @@
+"""Unit tests for logging_config module."""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from flexetl.logging_config import (
+    SampledLogger,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+class TestSetupLogging:
+    """Test setup_logging function."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self):
+        """Restore root logger handlers and level after each test."""
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        level = root.level
+        yield
+        root.handlers = handlers
+        root.setLevel(level)
+
+    def test_writes_through_queue_to_file(self, tmp_path):
+        """Test records reach the log file once the listener stops."""
+        log_file = tmp_path / "logs" / "pipeline.log"
+
+        listener = setup_logging(str(log_file))
+        logging.getLogger("flexetl.test").info("Loaded %d rows", 42)
+        listener.stop()
+
+        assert "Loaded 42 rows" in log_file.read_text()
+
+    def test_root_uses_queue_handler(self, tmp_path):
+        """Test the root logger only holds a queue handler."""
+        listener = setup_logging(str(tmp_path / "pipeline.log"))
+        listener.stop()
+
+        handlers = logging.getLogger().handlers
+        assert len(handlers) == 1
+        assert isinstance(handlers[0], logging.handlers.QueueHandler)
+
+    def test_closes_replaced_handlers(self, tmp_path):
+        """Test handlers removed from the root logger are closed."""
+        old_handler = logging.FileHandler(tmp_path / "old.log")
+        logging.getLogger().addHandler(old_handler)
+
+        listener = setup_logging(str(tmp_path / "pipeline.log"))
+        listener.stop()
+
+        assert old_handler.stream is None
+
+    def test_mutable_args_rendered_when_logged(self, tmp_path):
+        """Test arguments are rendered before later mutation."""
+        log_file = tmp_path / "pipeline.log"
+        columns = ['date']
+
+        listener = setup_logging(str(log_file))
+        logging.getLogger("flexetl.test").info("Grouping by %s", columns)
+        columns.append('product_id')
+        listener.stop()
+
+        assert "Grouping by ['date']\n" in log_file.read_text()
+
+
+class TestShutdownLogging:
+    """Test shutdown_logging function."""
+
+    @pytest.fixture(autouse=True)
+    def restore_root_logger(self):
+        """Restore root logger handlers and level after each test."""
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        level = root.level
+        yield
+        root.handlers = handlers
+        root.setLevel(level)
+
+    def test_flushes_closes_and_detaches(self, tmp_path):
+        """Test records are flushed, handlers closed and the queue removed."""
+        log_file = tmp_path / "pipeline.log"
+
+        listener = setup_logging(str(log_file))
+        logging.getLogger("flexetl.test").info("Loaded %d rows", 42)
+        shutdown_logging(listener)
+
+        assert "Loaded 42 rows" in log_file.read_text()
+        file_handler = listener.handlers[-1]
+        assert isinstance(file_handler, logging.FileHandler)
+        assert file_handler.stream is None
+        assert not any(
+            isinstance(h, logging.handlers.QueueHandler)
+            for h in logging.getLogger().handlers
+        )
+
+
+class TestSampledLogger:
+    """Test SampledLogger class."""
+
+    def test_samples_every_nth_event(self, caplog):
+        """Test only the first and every Nth occurrence is logged."""
+        sampled = SampledLogger(logging.getLogger("flexetl.test"), every=3)
+
+        with caplog.at_level(logging.INFO, logger="flexetl.test"):
+            for i in range(7):
+                sampled.log('filter', 1, "chunk %d", i)
+
+        assert [r.getMessage() for r in caplog.records] == [
+            "chunk 0", "chunk 3", "chunk 6"
+        ]
+
+    def test_summary_reports_totals_and_resets(self, caplog):
+        """Test summary includes all occurrences and clears counters."""
+        sampled = SampledLogger(logging.getLogger("flexetl.test"), every=100)
+
+        for _ in range(5):
+            sampled.log('filter', 2, "removed %d", 2)
+
+        with caplog.at_level(logging.INFO, logger="flexetl.test"):
+            totals = sampled.summary('transform')
+
+        assert totals == {'filter': 10}
+        assert "filter ran 5 times, total 10" in caplog.text
+        assert sampled.summary('transform') == {}
+
+    def test_invalid_interval(self):
+        """Test error when sampling interval is less than 1."""
+        with pytest.raises(ValueError, match="Sampling interval"):
+            SampledLogger(logging.getLogger("flexetl.test"), every=0)
@@ -0,0 +1,184 @@
+"""Unit tests for lookup module."""
+
+import os
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from flexetl.lookup import DimensionLookup
+
+
+class TestDimensionLookup:
+    """Test DimensionLookup class."""
+
+    @pytest.fixture
+    def products_csv(self, tmp_path):
+        """Create a product dimension CSV file."""
+        csv_file = tmp_path / "products.csv"
+        csv_file.write_text(
+            "product_id,category,unit_cost\n"
+            "P001,Computers,950.0\n"
+            "P002,Accessories,12.5\n"
+        )
+        return csv_file
+
+    def test_lookup_left_join(self, products_csv):
+        """Test values are aligned with keys and missing keys are null."""
+        lookup = DimensionLookup(
+            str(products_csv), 'product_id', ['category', 'unit_cost']
+        )
+        keys = pd.Series(['P002', 'P999', 'P001'], index=[10, 11, 12])
+
+        result = lookup.lookup(keys)
+
+        assert list(result.index) == [10, 11, 12]
+        assert result['unit_cost'].tolist()[0] == 12.5
+        assert pd.isna(result['category'].iloc[1])
+        assert result['category'].iloc[2] == 'Computers'
+        assert lookup.rows_unmatched == 1
+
+    def test_lookup_categorical_keys(self, products_csv):
+        """Test categorical keys are resolved through their categories."""
+        lookup = DimensionLookup(str(products_csv), 'product_id', ['category'])
+        keys = pd.Series(['P001', 'P002', None, 'P001'], dtype='category')
+
+        result = lookup.lookup(keys)
+
+        assert result['category'].tolist()[:2] == ['Computers', 'Accessories']
+        assert pd.isna(result['category'].iloc[2])
+        assert result['category'].iloc[3] == 'Computers'
+
+    def test_lookup_sqlite_source(self, tmp_path):
+        """Test loading the dimension from a SQLite table."""
+        db_path = tmp_path / "dims.db"
+        conn = sqlite3.connect(str(db_path))
+        pd.DataFrame({
+            'product_id': ['P001'], 'category': ['Computers']
+        }).to_sql('products', conn, index=False)
+        conn.close()
+
+        lookup = DimensionLookup(
+            str(db_path), 'product_id', ['category'], table_name='products'
+        )
+
+        result = lookup.lookup(pd.Series(['P001']))
+
+        assert result['category'].tolist() == ['Computers']
+
+    def test_index_rebuilt_after_wal_commit(self, tmp_path):
+        """Test a commit still in the SQLite WAL invalidates the index."""
+        db_path = tmp_path / "dims.db"
+        writer = sqlite3.connect(str(db_path))
+        writer.execute("PRAGMA journal_mode=WAL")
+        writer.execute("PRAGMA wal_autocheckpoint=0")
+        writer.execute("CREATE TABLE dims (k TEXT, v REAL)")
+        writer.execute("INSERT INTO dims VALUES ('a', 1.0)")
+        writer.commit()
+
+        lookup = DimensionLookup(str(db_path), 'k', ['v'], table_name='dims')
+        assert lookup.lookup(pd.Series(['a']))['v'].tolist() == [1.0]
+
+        writer.execute("UPDATE dims SET v = 2.0")
+        writer.commit()
+        try:
+            result = lookup.lookup(pd.Series(['a']))
+        finally:
+            writer.close()
+
+        assert result['v'].tolist() == [2.0]
+
+    def test_cache_file_per_column_set(self, tmp_path, products_csv):
+        """Test lookups on different columns keep separate cache files."""
+        cache_dir = tmp_path / "cache"
+        for columns in (['category'], ['unit_cost']):
+            DimensionLookup(
+                str(products_csv), 'product_id', columns,
+                cache_dir=str(cache_dir)
+            ).lookup(pd.Series(['P001']))
+
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_index_rebuilt_when_source_changes(self, products_csv):
+        """Test the cached index is invalidated by a source change."""
+        lookup = DimensionLookup(str(products_csv), 'product_id', ['category'])
+        lookup.lookup(pd.Series(['P001']))
+
+        products_csv.write_text("product_id,category\nP001,Laptops\n")
+        os.utime(products_csv, ns=(0, 0))
+
+        result = lookup.lookup(pd.Series(['P001']))
+
+        assert result['category'].tolist() == ['Laptops']
+
+    def test_lookup_categorical_without_categories(self, products_csv):
+        """Test all-null categorical keys are reported as not found."""
+        lookup = DimensionLookup(str(products_csv), 'product_id', ['category'])
+        keys = pd.Series([None, None], dtype='category')
+
+        result = lookup.lookup(keys)
+
+        assert result['category'].isna().all()
+        assert lookup.rows_unmatched == 2
+
+    def test_disk_cache_reused_across_runs(
+        self, tmp_path, products_csv, monkeypatch
+    ):
+        """Test a new instance reads the index from the cache directory."""
+        cache_dir = tmp_path / "cache"
+        first = DimensionLookup(
+            str(products_csv), 'product_id', ['category'],
+            cache_dir=str(cache_dir)
+        )
+        first.lookup(pd.Series(['P001']))
+
+        second = DimensionLookup(
+            str(products_csv), 'product_id', ['category'],
+            cache_dir=str(cache_dir)
+        )
+
+        def fail():
+            pytest.fail("dimension reloaded instead of read from cache")
+
+        monkeypatch.setattr(second, '_load_dimension', fail)
+
+        result = second.lookup(pd.Series(['P001']))
+
+        assert result['category'].tolist() == ['Computers']
+
+    def test_unreadable_cache_rebuilt(self, tmp_path, products_csv):
+        """Test a truncated cache file is ignored and rewritten."""
+        cache_dir = tmp_path / "cache"
+        first = DimensionLookup(
+            str(products_csv), 'product_id', ['category'],
+            cache_dir=str(cache_dir)
+        )
+        first.lookup(pd.Series(['P001']))
+        (cache_file,) = cache_dir.iterdir()
+        cache_file.write_bytes(cache_file.read_bytes()[:20])
+
+        second = DimensionLookup(
+            str(products_csv), 'product_id', ['category'],
+            cache_dir=str(cache_dir)
+        )
+        result = second.lookup(pd.Series(['P001']))
+
+        assert result['category'].tolist() == ['Computers']
+        assert list(cache_dir.iterdir()) == [cache_file]
+        assert len(cache_file.read_bytes()) > 20
+
+    def test_duplicate_keys(self, tmp_path):
+        """Test error when dimension keys are not unique."""
+        csv_file = tmp_path / "dupes.csv"
+        csv_file.write_text("product_id,category\nP001,A\nP001,B\n")
+        lookup = DimensionLookup(str(csv_file), 'product_id', ['category'])
+
+        with pytest.raises(ValueError, match="Duplicate keys"):
+            lookup.lookup(pd.Series(['P001']))
+
+    def test_source_not_found(self):
+        """Test error when the dimension source doesn't exist."""
+        lookup = DimensionLookup("missing.csv", 'product_id', ['category'])
+
+        with pytest.raises(FileNotFoundError):
+            lookup.lookup(pd.Series(['P001']))
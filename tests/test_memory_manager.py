@@ -0,0 +1,188 @@
+"""Unit tests for memory_manager module."""
+
+import logging
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from flexetl.scalability import memory_manager
+from flexetl.scalability.memory_manager import (
+    MB,
+    MemoryManager,
+    read_cgroup_cpu_limit,
+    read_cgroup_memory_limit,
+)
+
+
+class TestCgroupLimits:
+    """Test cgroup limit readers."""
+
+    def test_memory_limit_v2(self, tmp_path):
+        """Test reading a cgroup v2 memory limit."""
+        (tmp_path / "memory.max").write_text("536870912\n")
+
+        assert read_cgroup_memory_limit(tmp_path) == 512 * MB
+
+    def test_memory_limit_v2_unlimited(self, tmp_path):
+        """Test cgroup v2 'max' means no limit."""
+        (tmp_path / "memory.max").write_text("max\n")
+
+        assert read_cgroup_memory_limit(tmp_path) is None
+
+    def test_memory_limit_v1(self, tmp_path):
+        """Test reading a cgroup v1 memory limit."""
+        (tmp_path / "memory").mkdir()
+        (tmp_path / "memory" / "memory.limit_in_bytes").write_text(
+            "1073741824\n"
+        )
+
+        assert read_cgroup_memory_limit(tmp_path) == 1024 * MB
+
+    def test_memory_limit_v1_unlimited(self, tmp_path):
+        """Test cgroup v1 huge value means no limit."""
+        (tmp_path / "memory").mkdir()
+        (tmp_path / "memory" / "memory.limit_in_bytes").write_text(
+            "9223372036854771712\n"
+        )
+
+        assert read_cgroup_memory_limit(tmp_path) is None
+
+    def test_no_cgroup(self, tmp_path):
+        """Test missing cgroup files mean no limit."""
+        assert read_cgroup_memory_limit(tmp_path) is None
+        assert read_cgroup_cpu_limit(tmp_path) is None
+
+    def test_cpu_limit_v2(self, tmp_path):
+        """Test reading a cgroup v2 CPU quota."""
+        (tmp_path / "cpu.max").write_text("150000 100000\n")
+
+        assert read_cgroup_cpu_limit(tmp_path) == 2
+
+
+class TestMemoryManager:
+    """Test MemoryManager class."""
+
+    @pytest.fixture
+    def manager(self, monkeypatch):
+        """Create a manager with a fixed 100 MB budget and 4 CPUs."""
+        monkeypatch.setattr(
+            memory_manager, 'read_cgroup_memory_limit', lambda: None
+        )
+        monkeypatch.setattr(memory_manager, '_available_cpus', lambda: 4)
+        monkeypatch.setattr(memory_manager, 'current_rss', lambda: 0)
+        return MemoryManager(
+            budget_mb=100, overhead_factor=1.0, min_chunk_rows=100,
+            backpressure_timeout=0
+        )
+
+    def test_budget_uses_cgroup_limit(self, monkeypatch):
+        """Test the cgroup limit caps the configured budget."""
+        monkeypatch.setattr(
+            memory_manager, 'read_cgroup_memory_limit', lambda: 64 * MB
+        )
+
+        assert MemoryManager(budget_mb=1024).budget_bytes == 64 * MB
+
+    def test_estimate_row_bytes(self, manager):
+        """Test row size is estimated from the typed sample."""
+        sample = pd.DataFrame({'a': range(1000)}, dtype='int64')
+
+        row_bytes = manager.estimate_row_bytes(sample)
+
+        assert 8 <= row_bytes <= 9
+
+    def test_estimate_row_bytes_empty(self, manager):
+        """Test error when the sample is empty."""
+        with pytest.raises(ValueError, match="empty sample"):
+            manager.estimate_row_bytes(pd.DataFrame())
+
+    def test_plan_fits_budget(self, manager):
+        """Test chunks for all workers fit under the high watermark."""
+        chunk_rows, workers = manager.plan(row_bytes=1000)
+
+        assert workers == 4
+        assert (workers + 1) * chunk_rows * 1000 <= 80 * MB
+
+    def test_plan_reduces_workers_for_large_rows(self, manager):
+        """Test workers are reduced before chunks get too small."""
+        chunk_rows, workers = manager.plan(row_bytes=300_000)
+
+        assert workers < 4
+        assert chunk_rows >= 100
+
+    def test_plan_requires_row_size(self, manager):
+        """Test error when no row size is known."""
+        with pytest.raises(ValueError, match="Row size unknown"):
+            manager.plan()
+
+    def test_chunks_shrink_and_recover(self, manager, monkeypatch):
+        """Test chunk size halves under pressure and grows back."""
+        manager.plan(row_bytes=1000)
+        planned = manager.chunk_rows
+
+        monkeypatch.setattr(memory_manager, 'current_rss', lambda: 85 * MB)
+        assert manager.next_chunk_rows() == -(-planned // 2)
+
+        monkeypatch.setattr(memory_manager, 'current_rss', lambda: 10 * MB)
+        assert manager.next_chunk_rows() == planned
+
+    def test_chunks_never_below_minimum(self, manager, monkeypatch):
+        """Test shrinking stops at min_chunk_rows."""
+        manager.plan(row_bytes=1000)
+        monkeypatch.setattr(memory_manager, 'current_rss', lambda: 99 * MB)
+
+        for _ in range(20):
+            rows = manager.next_chunk_rows()
+
+        assert rows == 100
+
+    def test_no_wait_without_chunks_in_flight(self, manager, monkeypatch):
+        """Test near the budget with nothing in flight only shrinks."""
+        manager.backpressure_timeout = 30
+        manager.plan(row_bytes=1000)
+        planned = manager.chunk_rows
+        monkeypatch.setattr(memory_manager, 'current_rss', lambda: 99 * MB)
+
+        start = time.monotonic()
+        rows = manager.next_chunk_rows()
+
+        assert time.monotonic() - start < 1
+        assert rows == -(-planned // 2)
+
+    def test_waits_for_chunk_in_flight(self, manager, monkeypatch):
+        """Test backpressure waits until an in-flight chunk frees memory."""
+        manager.backpressure_timeout = 30
+        manager.plan(row_bytes=1000)
+        rss = [99 * MB]
+        monkeypatch.setattr(memory_manager, 'current_rss', lambda: rss[0])
+
+        def finish_chunk():
+            rss[0] = 10 * MB
+            manager.chunk_finished()
+
+        manager.chunk_started()
+        timer = threading.Timer(0.1, finish_chunk)
+        timer.start()
+        start = time.monotonic()
+        manager.next_chunk_rows()
+        timer.join()
+
+        assert 0.05 <= time.monotonic() - start < 5
+
+    def test_stops_waiting_after_timeout(self, manager, monkeypatch, caplog):
+        """Test later reads skip backpressure once a wait timed out."""
+        manager.backpressure_timeout = 0.1
+        manager.plan(row_bytes=1000)
+        monkeypatch.setattr(memory_manager, 'current_rss', lambda: 99 * MB)
+        manager.chunk_started()
+
+        with caplog.at_level(logging.INFO):
+            manager.next_chunk_rows()
+            start = time.monotonic()
+            manager.next_chunk_rows()
+
+        assert time.monotonic() - start < 0.1
+        warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+        assert len(warnings) == 1
@@ -0,0 +1,205 @@
+"""Unit tests for quality_checker module."""
+
+import logging
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from flexetl.loader import SQLiteLoader
+from flexetl.validators import DataQualityChecker
+
+
+class TestDataQualityChecker:
+    """Test DataQualityChecker class."""
+
+    @pytest.fixture
+    def sample_data(self):
+        """Create sample DataFrame with one violation per bad row."""
+        return pd.DataFrame({
+            'date': ['2026-02-01', '2026-02-31', '2026-02-02', '2026-02-03'],
+            'product_id': ['P001', 'P002', 'X9', 'P004'],
+            'quantity': [2, 5, 1, None],
+            'unit_price': [100.0, 25.0, 100.0, 10.0]
+        })
+
+    @pytest.fixture
+    def checker(self):
+        """Create checker with one rule of each kind."""
+        return (
+            DataQualityChecker()
+            .add_not_null(['quantity'])
+            .add_range('quantity', min_value=1)
+            .add_regex('product_id', r'P\d+')
+            .add_date('date')
+        )
+
+    def test_validate_keeps_valid_rows(self, checker, sample_data):
+        """Test only rows passing every rule are returned."""
+        result = checker.validate(sample_data)
+
+        assert result['product_id'].tolist() == ['P001']
+
+    def test_violation_counts(self, checker, sample_data):
+        """Test violations are counted per rule."""
+        checker.validate(sample_data)
+        checker.validate(sample_data)
+
+        assert checker.violation_counts == {
+            'not_null:quantity': 2,
+            'range:quantity': 0,
+            'regex:product_id': 2,
+            'date:date': 2,
+        }
+        assert checker.rows_checked == 8
+        assert checker.rows_rejected == 6
+
+    def test_range_bounds(self):
+        """Test inclusive bounds and non-numeric values."""
+        df = pd.DataFrame({'value': [0, 1, 10, 11, 'abc']})
+        checker = DataQualityChecker().add_range('value', 1, 10)
+
+        result = checker.validate(df)
+
+        assert result['value'].tolist() == [1, 10]
+
+    def test_date_window(self):
+        """Test dates outside the allowed window are rejected."""
+        df = pd.DataFrame({
+            'date': ['2026-01-31', '2026-02-01', '2026-02-07', '2026-02-08']
+        })
+        checker = DataQualityChecker().add_date(
+            'date', start='2026-02-01', end='2026-02-07'
+        )
+
+        result = checker.validate(df)
+
+        assert result['date'].tolist() == ['2026-02-01', '2026-02-07']
+
+    def test_missing_column(self):
+        """Test error when a rule refers to a missing column."""
+        checker = DataQualityChecker().add_not_null(['missing'])
+
+        with pytest.raises(ValueError, match="Column not found"):
+            checker.validate(pd.DataFrame({'value': [1]}))
+
+    def test_quarantine_batches(self, tmp_path, sample_data):
+        """Test rejected rows are written in batches with reason codes."""
+        db_path = tmp_path / "test.db"
+        checker = (
+            DataQualityChecker(
+                quarantine_loader=SQLiteLoader(
+                    database_path=str(db_path),
+                    table_name="quarantine",
+                    if_exists="replace"
+                ),
+                batch_size=4
+            )
+            .add_not_null(['quantity'])
+            .add_regex('product_id', r'P\d+')
+            .add_date('date')
+        )
+
+        checker.validate(sample_data)
+        assert not db_path.exists()
+
+        checker.validate(sample_data)
+        assert checker.rows_quarantined == 6
+
+        checker.validate(sample_data)
+        assert checker.flush() == 3
+
+        conn = sqlite3.connect(str(db_path))
+        quarantined = pd.read_sql('SELECT * FROM quarantine', conn)
+        conn.close()
+
+        assert len(quarantined) == 9
+        assert set(quarantined['reason_codes']) == {
+            'date:date', 'regex:product_id', 'not_null:quantity'
+        }
+
+    def test_flush_leaves_loader_unchanged(self, tmp_path, sample_data):
+        """Test later batches append without modifying the loader."""
+        loader = SQLiteLoader(
+            database_path=str(tmp_path / "test.db"),
+            table_name="quarantine",
+            if_exists="replace"
+        )
+        checker = DataQualityChecker(quarantine_loader=loader)
+        checker.add_not_null(['quantity'])
+
+        checker.validate(sample_data)
+        checker.flush()
+        checker.validate(sample_data)
+        checker.flush()
+
+        assert loader.if_exists == 'replace'
+        assert loader.verify_load() == 2
+
+    def test_reset_quarantine_clears_previous_run(
+        self, tmp_path, sample_data
+    ):
+        """Test a run without rejects leaves no rows from earlier runs."""
+        db_path = str(tmp_path / "test.db")
+
+        def run(data):
+            checker = DataQualityChecker(
+                quarantine_loader=SQLiteLoader(
+                    database_path=db_path,
+                    table_name="quarantine",
+                    if_exists="replace"
+                )
+            ).add_not_null(['quantity'])
+            checker.reset_quarantine()
+            checker.validate(data)
+            checker.flush()
+
+        run(sample_data)
+        run(sample_data.dropna(subset=['quantity']))
+
+        conn = sqlite3.connect(db_path)
+        tables = conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = 'quarantine'"
+        ).fetchall()
+        conn.close()
+
+        assert tables == []
+
+    def test_checkers_sample_independently(self, sample_data, caplog):
+        """Test each checker logs its own first chunk."""
+        first = DataQualityChecker().add_not_null(['quantity'])
+        second = DataQualityChecker().add_not_null(['quantity'])
+
+        with caplog.at_level(logging.INFO):
+            first.validate(sample_data)
+            second.validate(sample_data)
+            first.log_summary()
+
+        assert caplog.text.count("Rejected 1 of 4 rows") == 2
+        assert "ran 1 times" not in caplog.text
+
+    def test_multiple_reason_codes(self, tmp_path):
+        """Test rows failing several rules list every reason code."""
+        df = pd.DataFrame({'product_id': ['bad'], 'quantity': [0]})
+        checker = (
+            DataQualityChecker(
+                quarantine_loader=SQLiteLoader(
+                    database_path=str(tmp_path / "test.db"),
+                    table_name="quarantine"
+                )
+            )
+            .add_range('quantity', min_value=1)
+            .add_regex('product_id', r'P\d+')
+        )
+
+        checker.validate(df)
+        rejected = pd.concat(checker._buffer)
+
+        assert rejected['reason_codes'].tolist() == [
+            'range:quantity;regex:product_id'
+        ]
+
+    def test_invalid_batch_size(self):
+        """Test error when batch size is less than 1."""
+        with pytest.raises(ValueError, match="Batch size"):
+            DataQualityChecker(batch_size=0)
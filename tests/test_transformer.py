@@ -1,9 +1,15 @@
 """Unit tests for transformer module."""
 
+import logging
+
 import pandas as pd
 import pytest
 
+from flexetl.deduplicator import Deduplicator
+from flexetl.lookup import DimensionLookup
+from flexetl.scalability import MemoryManager
 from flexetl.transformer import DataTransformer
+from flexetl.validators import DataQualityChecker
 
 
 class TestDataTransformer:
@@ -98,6 +104,22 @@ class TestDataTransformer:
         a_total = result[result['product'] == 'A']['total'].iloc[0]
         assert a_total == 40
 
+    def test_aggregate_logs_are_sampled(self, caplog):
+        """Test repeated per-chunk aggregates log only the first time."""
+        df = pd.DataFrame({'product_id': ['P001'], 'quantity': [2]})
+        DataTransformer.log_summary()
+
+        with caplog.at_level(logging.INFO):
+            for _ in range(3):
+                DataTransformer(df).aggregate(
+                    group_by=['product_id'],
+                    aggregations={'total_quantity': 'sum(quantity)'}
+                )
+            DataTransformer.log_summary()
+
+        assert caplog.text.count("Aggregated by") == 1
+        assert "aggregate ran 3 times" in caplog.text
+
     def test_aggregate_invalid_column(self):
         """Test error with invalid grouping column."""
         df = pd.DataFrame({'value': [1, 2, 3]})
@@ -120,3 +142,73 @@ class TestDataTransformer:
 
         assert len(result) == 2
         assert all(result['quantity'] > 1)
+
+    def test_validate(self, sample_data):
+        """Test rows failing quality rules are removed."""
+        checker = DataQualityChecker().add_not_null(['quantity'])
+
+        result = DataTransformer(sample_data).validate(checker).get_result()
+
+        assert len(result) == 2
+        assert checker.rows_rejected == 1
+
+    def test_deduplicate(self, sample_data):
+        """Test rows with repeated keys are removed."""
+        dedup = Deduplicator(['product_id'])
+
+        result = (
+            DataTransformer(sample_data).deduplicate(dedup).get_result()
+        )
+
+        assert result['product_id'].tolist() == ['P001', 'P002']
+
+    def test_enrich_and_calculate_margin(self, tmp_path):
+        """Test enriching rows with dimension columns and margin."""
+        csv_file = tmp_path / "products.csv"
+        csv_file.write_text("product_id,unit_cost\nP001,60.0\nP002,20.0\n")
+        lookup = DimensionLookup(str(csv_file), 'product_id', ['unit_cost'])
+        df = pd.DataFrame({
+            'product_id': ['P001', 'P002'],
+            'quantity': [2, 5],
+            'revenue': [200.0, 125.0]
+        })
+
+        result = (
+            DataTransformer(df)
+            .enrich(lookup, 'product_id')
+            .calculate_margin('revenue', 'quantity', 'unit_cost')
+            .get_result()
+        )
+
+        assert result['margin'].tolist() == [80.0, 25.0]
+
+    def test_enrich_invalid_column(self, tmp_path):
+        """Test error when enriching on a non-existent key column."""
+        lookup = DimensionLookup(
+            str(tmp_path / "products.csv"), 'product_id', ['unit_cost']
+        )
+        transformer = DataTransformer(pd.DataFrame({'value': [1]}))
+
+        with pytest.raises(ValueError, match="Column not found"):
+            transformer.enrich(lookup, 'product_id')
+
+    def test_map_chunks_parallel(self):
+        """Test chunks are transformed in parallel and keep their order."""
+        chunks = [
+            pd.DataFrame({'value': [i, i + 100]}) for i in range(10)
+        ]
+        manager = MemoryManager(budget_mb=64)
+        manager.workers = 3
+
+        results = list(
+            DataTransformer.map_chunks(
+                chunks,
+                lambda t: t.filter_by_value('value', '<', 100),
+                manager
+            )
+        )
+
+        assert [r['value'].tolist() for r in results] == [
+            [i] for i in range(10)
+        ]
+        assert manager._in_flight == 0